@@ -5,62 +5,90 @@ This is a minimal implementation showing the core EAT workflow.
 """
 
 import asyncio
+import logging
 import sys
 import os
+from collections import defaultdict
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+# Add parent directory to path for imports (once; repeated imports must
+# not keep prepending the same entry)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from eat import Catalog
+from eat.mcp_client import MCPError
+
+log = logging.getLogger("eat.demo")
 
 
 async def main():
     """Simple agent that discovers and uses a customer management tool."""
-    print("🚀 Starting Simple EAT Agent Demo")
-    print("=" * 40)
+    log.info("🚀 Starting Simple EAT Agent Demo")
+    log.info("=" * 40)
     
     try:
         # Step 1: Discover tools
-        print("🔍 Discovering tools from catalog...")
+        log.info("🔍 Discovering tools from catalog...")
         catalog = Catalog("http://localhost:8000/.well-known/api-catalog", verify_signatures=False)
         await catalog.fetch()
         
-        print(f"✅ Found {len(catalog.tools)} tools in catalog")
-        
+        # Snapshot the tool list once and index it by capability, so each
+        # lookup below is a dict hit instead of a scan over catalog.tools.
+        tools = tuple(catalog.tools)
+        tools_by_capability = defaultdict(list)
+        for tool in tools:
+            for capability in tool.capabilities:
+                tools_by_capability[capability].append(tool)
+
+        log.info("✅ Found %d tools in catalog", len(tools))
+
         # Step 2: Find customer management tools
-        customer_tools = catalog.find(capability="customer")
+        customer_tools = tools_by_capability.get("customer", [])
         if not customer_tools:
-            print("⚠️  No customer management tools found")
-            print("💡 Available tools:")
-            for tool in catalog.tools:
-                print(f"   • {tool.id}: {tool.description}")
+            log.info("⚠️  No customer management tools found")
+            # One joined message means one write instead of a line per tool.
+            log.info("💡 Available tools:\n%s",
+                     "\n".join(f"   • {t.id}: {t.description}" for t in tools))
             return
         
         # Step 3: Use the first customer tool
         tool = customer_tools[0]
-        print(f"🔧 Using tool: {tool.id}")
-        print(f"📝 Description: {tool.description}")
+        log.info("🔧 Using tool: %s", tool.id)
+        log.info("📝 Description: %s", tool.description)
         
         # Step 4: Call the tool (example: get customer by ID)
-        print("📞 Calling tool with sample data...")
+        log.info("📞 Calling tool with sample data...")
         
         try:
             result = await tool.call(customer_id=1)
-            print("✅ Tool call successful!")
-            print(f"📊 Result: {result}")
+            log.info("✅ Tool call successful!")
+            log.info("📊 Result: %s", result)
             
-        except Exception as tool_error:
-            print(f"⚠️  Tool call failed: {tool_error}")
-            print("💡 This is expected if MCP servers are not running")
-            print("   Run 'docker-compose up' in the demo directory to start servers")
+        except (MCPError, ValueError) as tool_error:
+            log.info("⚠️  Tool call failed: %s", tool_error)
+            log.info("💡 This is expected if MCP servers are not running")
+            log.info("   Run 'docker-compose up' in the demo directory to start servers")
         
     except Exception as e:
-        print(f"❌ Error: {e}")
-        print("\n🔧 Troubleshooting:")
-        print("   1. Make sure the demo server is running: cd demo && ./quickstart.sh")
-        print("   2. Check that the catalog is available at: http://localhost:8000/.well-known/api-catalog")
-        print("   3. Ensure OpenAPI specs are in the specs/ directory with x-mcp-tool extensions")
+        log.info("❌ Error: %s", e)
+        log.info("\n🔧 Troubleshooting:")
+        log.info("   1. Make sure the demo server is running: cd demo && ./quickstart.sh")
+        log.info("   2. Check that the catalog is available at: http://localhost:8000/.well-known/api-catalog")
+        log.info("   3. Ensure OpenAPI specs are in the specs/ directory with x-mcp-tool extensions")
+
+
+def run():
+    """Run the demo on a fresh event loop with eager task execution."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    loop = asyncio.new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+        loop.set_task_factory(asyncio.eager_task_factory)
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
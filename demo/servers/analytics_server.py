@@ -5,25 +5,36 @@ Provides data aggregation and reporting capabilities.
 """
 
 import asyncio
-import json
+import hashlib
+import hmac
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import random
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Union
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import uvicorn
 import httpx
+import numpy as np
+import orjson
 
 
-# Authentication
+# Authentication. The expected token is resolved once at import (env
+# override for non-demo deployments) and compared in constant time.
 security = HTTPBearer()
+_MCP_TOKEN = os.getenv("MCP_TOKEN", "demo-token-12345")
+_EXPECTED_TOKEN = _MCP_TOKEN.encode()
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Simple token verification for demo purposes."""
-    if credentials.credentials != "demo-token-12345":
+    if not hmac.compare_digest(credentials.credentials.encode(), _EXPECTED_TOKEN):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
@@ -31,23 +42,130 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     return credentials.credentials
 
 
+class MCPRequest(BaseModel):
+    """JSON-RPC 2.0 envelope for the MCP endpoint, validated once by
+    Pydantic instead of being pulled apart by hand from a raw dict."""
+    jsonrpc: str = "2.0"
+    id: Union[str, int] = "unknown"
+    method: str
+    params: Dict = {}
+
+
+# Configuration
+CUSTOMER_SERVICE_URL = os.getenv("CUSTOMER_SERVICE_URL", "http://localhost:3001")
+
+# Shared HTTP client with keep-alive pooling; created in lifespan so every
+# customer-service call reuses warm connections instead of paying a fresh
+# TCP handshake per request.
+http_client: Optional[httpx.AsyncClient] = None
+
+
 # FastAPI app setup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    global http_client
+    http_client = httpx.AsyncClient(
+        base_url=CUSTOMER_SERVICE_URL,
+        headers={"Authorization": f"Bearer {_MCP_TOKEN}"},
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=10.0
+    )
     yield
     # Shutdown
-    pass
+    await http_client.aclose()
+    http_client = None
 
 app = FastAPI(
     title="Analytics API",
     description="MCP Server for data aggregation and reporting",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Configuration
-CUSTOMER_SERVICE_URL = os.getenv("CUSTOMER_SERVICE_URL", "http://localhost:3001")
+# Compress large JSON payloads (analytics responses with per-customer
+# maps compress heavily); small responses skip the middleware entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# The tools/list result is immutable, so build it once at import time
+# instead of re-allocating the schema tree per request.
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "customer_analytics",
+            "description": "Generate analytics report for customers",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "customer_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "List of customer IDs to analyze"
+                    },
+                    "metrics": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Metrics to include: engagement, revenue, retention"
+                    }
+                }
+            }
+        },
+        {
+            "name": "company_analytics",
+            "description": "Generate analytics by company",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "company": {"type": "string", "description": "Company name"},
+                    "include_trends": {"type": "boolean", "description": "Include trend analysis"}
+                }
+            }
+        },
+        {
+            "name": "generate_report",
+            "description": "Generate formatted analytics report",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "template": {
+                        "type": "string",
+                        "enum": ["summary", "detailed", "executive"],
+                        "description": "Report template"
+                    },
+                    "data": {"type": "object", "description": "Analytics data"},
+                    "format": {
+                        "type": "string",
+                        "enum": ["json", "html", "pdf"],
+                        "description": "Output format"
+                    }
+                },
+                "required": ["template", "data"]
+            }
+        },
+        {
+            "name": "trend_analysis",
+            "description": "Perform trend analysis on customer data",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "period": {
+                        "type": "string",
+                        "enum": ["week", "month", "quarter"],
+                        "description": "Analysis period"
+                    },
+                    "metric": {
+                        "type": "string",
+                        "enum": ["customers", "revenue", "engagement"],
+                        "description": "Metric to analyze"
+                    }
+                },
+                "required": ["period", "metric"]
+            }
+        }
+    ]
+}
 
 
 # API Endpoints
@@ -58,108 +176,28 @@ async def health_check():
 
 
 @app.post("/mcp", dependencies=[Depends(verify_token)])
-async def mcp_endpoint(request: Dict):
+async def mcp_endpoint(request: MCPRequest):
     """MCP protocol endpoint."""
-    method = request.get("method")
-    params = request.get("params", {})
-    request_id = request.get("id", "unknown")
+    method = request.method
+    params = request.params
+    request_id = request.id
     
     try:
         if method == "tools/list":
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "customer_analytics",
-                            "description": "Generate analytics report for customers",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "customer_ids": {
-                                        "type": "array",
-                                        "items": {"type": "integer"},
-                                        "description": "List of customer IDs to analyze"
-                                    },
-                                    "metrics": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "Metrics to include: engagement, revenue, retention"
-                                    }
-                                }
-                            }
-                        },
-                        {
-                            "name": "company_analytics",
-                            "description": "Generate analytics by company",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "company": {"type": "string", "description": "Company name"},
-                                    "include_trends": {"type": "boolean", "description": "Include trend analysis"}
-                                }
-                            }
-                        },
-                        {
-                            "name": "generate_report",
-                            "description": "Generate formatted analytics report",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "template": {
-                                        "type": "string",
-                                        "enum": ["summary", "detailed", "executive"],
-                                        "description": "Report template"
-                                    },
-                                    "data": {"type": "object", "description": "Analytics data"},
-                                    "format": {
-                                        "type": "string",
-                                        "enum": ["json", "html", "pdf"],
-                                        "description": "Output format"
-                                    }
-                                },
-                                "required": ["template", "data"]
-                            }
-                        },
-                        {
-                            "name": "trend_analysis",
-                            "description": "Perform trend analysis on customer data",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "period": {
-                                        "type": "string",
-                                        "enum": ["week", "month", "quarter"],
-                                        "description": "Analysis period"
-                                    },
-                                    "metric": {
-                                        "type": "string",
-                                        "enum": ["customers", "revenue", "engagement"],
-                                        "description": "Metric to analyze"
-                                    }
-                                },
-                                "required": ["period", "metric"]
-                            }
-                        }
-                    ]
-                }
+                "result": TOOLS_LIST_RESULT
             }
         
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
-            if tool_name == "customer_analytics":
-                result = await customer_analytics_impl(arguments)
-            elif tool_name == "company_analytics":
-                result = await company_analytics_impl(arguments)
-            elif tool_name == "generate_report":
-                result = await generate_report_impl(arguments)
-            elif tool_name == "trend_analysis":
-                result = await trend_analysis_impl(arguments)
-            else:
+            impl = _TOOLS.get(tool_name)
+            if impl is None:
                 raise ValueError(f"Unknown tool: {tool_name}")
+            result = await impl(arguments)
             
             return {
                 "jsonrpc": "2.0",
@@ -184,107 +222,124 @@ async def mcp_endpoint(request: Dict):
 # Tool implementations
 async def get_customers_data(customer_ids: List[int] = None, company: str = None):
     """Fetch customer data from customer service."""
-    async with httpx.AsyncClient() as client:
-        headers = {"Authorization": "Bearer demo-token-12345"}
-        
-        if customer_ids:
-            customers = []
-            for customer_id in customer_ids:
-                try:
-                    response = await client.post(
-                        f"{CUSTOMER_SERVICE_URL}/mcp",
-                        json={
-                            "jsonrpc": "2.0",
-                            "id": f"get_customer_{customer_id}",
-                            "method": "tools/call",
-                            "params": {
-                                "name": "get_customer",
-                                "arguments": {"customer_id": customer_id}
-                            }
-                        },
-                        headers=headers
-                    )
-                    if response.status_code == 200:
-                        result = response.json()
-                        if "result" in result:
-                            customers.append(result["result"])
-                except Exception:
-                    pass
-            return customers
-        
-        elif company:
-            try:
-                response = await client.post(
-                    f"{CUSTOMER_SERVICE_URL}/mcp",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": "list_customers_by_company",
-                        "method": "tools/call",
-                        "params": {
-                            "name": "list_customers",
-                            "arguments": {"company": company}
-                        }
-                    },
-                    headers=headers
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("result", [])
-            except Exception:
-                pass
-        
-        else:
-            # Get all customers
-            try:
-                response = await client.post(
-                    f"{CUSTOMER_SERVICE_URL}/mcp",
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": "list_all_customers",
-                        "method": "tools/call",
-                        "params": {
-                            "name": "list_customers",
-                            "arguments": {"limit": 1000}
-                        }
-                    },
-                    headers=headers
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("result", [])
-            except Exception:
-                pass
-        
+    if customer_ids:
+        # One bulk round-trip instead of a request per ID: the customer
+        # service resolves the whole list with a single IN (...) query.
+        try:
+            response = await http_client.post(
+                "/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": "get_customers_bulk",
+                    "method": "tools/call",
+                    "params": {
+                        "name": "get_customers_bulk",
+                        "arguments": {"ids": list(customer_ids)}
+                    }
+                }
+            )
+            if response.status_code == 200:
+                result = response.json()
+                if "result" in result:
+                    return result["result"]
+        except Exception:
+            pass
         return []
 
+    elif company:
+        try:
+            response = await http_client.post(
+                "/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": "list_customers_by_company",
+                    "method": "tools/call",
+                    "params": {
+                        "name": "list_customers",
+                        "arguments": {"company": company}
+                    }
+                }
+            )
+            if response.status_code == 200:
+                result = response.json()
+                return result.get("result", [])
+        except Exception:
+            pass
+
+    else:
+        # Get all customers
+        try:
+            response = await http_client.post(
+                "/mcp",
+                json={
+                    "jsonrpc": "2.0",
+                    "id": "list_all_customers",
+                    "method": "tools/call",
+                    "params": {
+                        "name": "list_customers",
+                        "arguments": {"limit": 1000}
+                    }
+                }
+            )
+            if response.status_code == 200:
+                result = response.json()
+                return result.get("result", [])
+        except Exception:
+            pass
+
+    return []
+
+
+_ACTIVITY_LEVELS = np.array(["low", "medium", "high"])
+
+
+class MetricArrays(NamedTuple):
+    """Per-customer metric columns kept as arrays until serialization.
+
+    Reductions (means, totals) run in C on the arrays; the per-id dicts
+    are only materialized for metrics the caller actually asked for.
+    """
+    ids: list
+    engagement: np.ndarray
+    revenue: np.ndarray
+    retention: np.ndarray
+    activity: np.ndarray
+
+    def per_id(self, values: np.ndarray) -> Dict:
+        return dict(zip(self.ids, values.tolist()))
 
-def generate_mock_metrics(customers: List[Dict]) -> Dict:
+
+_EMPTY_METRICS = MetricArrays(
+    [], np.empty(0), np.empty(0), np.empty(0), np.empty(0)
+)
+
+
+def generate_mock_metrics(customers: List[Dict]) -> MetricArrays:
     """Generate mock analytics metrics for demo purposes."""
-    import random
-    import hashlib
-    
-    metrics = {
-        "total_customers": len(customers),
-        "engagement_scores": {},
-        "revenue_estimates": {},
-        "retention_rates": {},
-        "activity_levels": {}
-    }
-    
-    for customer in customers:
-        customer_id = customer.get("id", 0)
-        email = customer.get("email", "")
-        
-        # Use email hash for consistent "random" values
-        seed = int(hashlib.md5(email.encode()).hexdigest()[:8], 16)
-        random.seed(seed)
-        
-        metrics["engagement_scores"][customer_id] = round(random.uniform(0.1, 1.0), 2)
-        metrics["revenue_estimates"][customer_id] = round(random.uniform(100, 5000), 2)
-        metrics["retention_rates"][customer_id] = round(random.uniform(0.6, 0.95), 2)
-        metrics["activity_levels"][customer_id] = random.choice(["low", "medium", "high"])
-    
-    return metrics
+    if not customers:
+        return _EMPTY_METRICS
+
+    ids = [customer.get("id", 0) for customer in customers]
+
+    # Each customer's email hash yields four 32-bit words; scaling those
+    # into the metric ranges replaces the per-customer seed/uniform loop
+    # with a handful of vectorized array operations while staying
+    # deterministic per email. blake2b is faster than md5 on CPython and
+    # emits exactly the 16 bytes we consume.
+    digests = b"".join(
+        hashlib.blake2b(customer.get("email", "").encode(), digest_size=16).digest()
+        for customer in customers
+    )
+    words = np.frombuffer(digests, dtype="<u4").reshape(len(ids), 4)
+    uniform = words[:, :3] / np.float64(2 ** 32)
+
+    return MetricArrays(
+        ids=ids,
+        engagement=(0.1 + 0.9 * uniform[:, 0]).round(2),
+        revenue=(100 + 4900 * uniform[:, 1]).round(2),
+        retention=(0.6 + 0.35 * uniform[:, 2]).round(2),
+        activity=_ACTIVITY_LEVELS[words[:, 3] % 3],
+    )
 
 
 async def customer_analytics_impl(arguments: Dict):
@@ -301,27 +356,27 @@ async def customer_analytics_impl(arguments: Dict):
     # Filter metrics based on request
     result = {
         "customer_count": len(customers),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "metrics": {}
     }
     
     if "engagement" in requested_metrics:
         result["metrics"]["engagement"] = {
-            "average": round(sum(metrics["engagement_scores"].values()) / len(metrics["engagement_scores"]), 2),
-            "individual": metrics["engagement_scores"]
+            "average": round(float(metrics.engagement.mean()), 2),
+            "individual": metrics.per_id(metrics.engagement)
         }
     
     if "revenue" in requested_metrics:
         result["metrics"]["revenue"] = {
-            "total": round(sum(metrics["revenue_estimates"].values()), 2),
-            "average": round(sum(metrics["revenue_estimates"].values()) / len(metrics["revenue_estimates"]), 2),
-            "individual": metrics["revenue_estimates"]
+            "total": round(float(metrics.revenue.sum()), 2),
+            "average": round(float(metrics.revenue.mean()), 2),
+            "individual": metrics.per_id(metrics.revenue)
         }
     
     if "retention" in requested_metrics:
         result["metrics"]["retention"] = {
-            "average": round(sum(metrics["retention_rates"].values()) / len(metrics["retention_rates"]), 2),
-            "individual": metrics["retention_rates"]
+            "average": round(float(metrics.retention.mean()), 2),
+            "individual": metrics.per_id(metrics.retention)
         }
     
     return result
@@ -344,11 +399,11 @@ async def company_analytics_impl(arguments: Dict):
     result = {
         "company": company,
         "customer_count": len(customers),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "summary": {
-            "total_estimated_revenue": round(sum(metrics["revenue_estimates"].values()), 2),
-            "average_engagement": round(sum(metrics["engagement_scores"].values()) / len(metrics["engagement_scores"]), 2),
-            "average_retention": round(sum(metrics["retention_rates"].values()) / len(metrics["retention_rates"]), 2)
+            "total_estimated_revenue": round(float(metrics.revenue.sum()), 2),
+            "average_engagement": round(float(metrics.engagement.mean()), 2),
+            "average_retention": round(float(metrics.retention.mean()), 2)
         }
     }
     
@@ -380,7 +435,7 @@ async def generate_report_impl(arguments: Dict):
     if format_type == "json":
         return {
             "report_type": template,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso(),
             "format": "json",
             "content": data
         }
@@ -389,7 +444,7 @@ async def generate_report_impl(arguments: Dict):
         html_content = generate_html_report(template, data)
         return {
             "report_type": template,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso(),
             "format": "html",
             "content": html_content
         }
@@ -397,7 +452,7 @@ async def generate_report_impl(arguments: Dict):
     elif format_type == "pdf":
         return {
             "report_type": template,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso(),
             "format": "pdf",
             "content": "PDF generation not implemented in demo",
             "download_url": "https://example.com/reports/analytics.pdf"
@@ -407,36 +462,98 @@ async def generate_report_impl(arguments: Dict):
         raise ValueError(f"Unsupported format: {format_type}")
 
 
-def generate_html_report(template: str, data: Dict) -> str:
-    """Generate HTML report content."""
-    title = f"{template.title()} Analytics Report"
-    
-    html = f"""
+# The report template never changes, so it is compiled once into bytes
+# fragments; per request only the title, timestamp and JSON body are
+# spliced in with a single join instead of re-rendering the whole
+# template through an f-string.
+_HTML_HEAD = b"""
     <html>
     <head>
-        <title>{title}</title>
+        <title>"""
+_HTML_STYLE = b"""</title>
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background: #f4f4f4; padding: 20px; border-radius: 5px; }}
-            .metric {{ margin: 10px 0; padding: 10px; border-left: 3px solid #007cba; }}
-            .summary {{ background: #e7f3ff; padding: 15px; border-radius: 5px; }}
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            .header { background: #f4f4f4; padding: 20px; border-radius: 5px; }
+            .metric { margin: 10px 0; padding: 10px; border-left: 3px solid #007cba; }
+            .summary { background: #e7f3ff; padding: 15px; border-radius: 5px; }
         </style>
     </head>
     <body>
         <div class="header">
-            <h1>{title}</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <h1>"""
+_HTML_GENERATED = b"""</h1>
+            <p>Generated: """
+_HTML_MID = b"""</p>
         </div>
         
         <div class="summary">
             <h2>Summary</h2>
-            <pre>{json.dumps(data, indent=2)}</pre>
+            <pre>"""
+_HTML_TAIL = b"""</pre>
         </div>
     </body>
     </html>
     """
+
+
+def generate_html_report(template: str, data: Dict) -> str:
+    """Generate HTML report content."""
+    title = f"{template.title()} Analytics Report".encode()
+    generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S').encode()
     
-    return html
+    return b"".join((
+        _HTML_HEAD, title,
+        _HTML_STYLE, title,
+        _HTML_GENERATED, generated,
+        _HTML_MID, orjson.dumps(data, option=orjson.OPT_INDENT_2),
+        _HTML_TAIL,
+    )).decode()
+
+
+@lru_cache(maxsize=1)
+def _iso_ts(bucket: int) -> str:
+    """ISO timestamp at second granularity, shared within the second."""
+    return datetime.fromtimestamp(bucket).isoformat()
+
+
+def now_iso() -> str:
+    return _iso_ts(int(time.time()))
+
+
+# Dedicated RNG instance: the global `random` module RNG is shared
+# mutable state, and seeding or drawing from it is not safe once the
+# server handles requests concurrently.
+_trend_rng = random.Random()
+
+
+_QS = ("Q1", "Q2", "Q3", "Q4")
+
+
+@lru_cache(maxsize=8)
+def _trend_periods(period: str, today: date) -> tuple:
+    """Return the four most recent period labels, cached per day.
+
+    Months and quarters are derived with integer arithmetic, which is
+    both cheaper than datetime round-trips and correct across year
+    boundaries (the old quarter modulo and 30-day month offsets were
+    not).
+    """
+    if period == "week":
+        current_date = datetime(today.year, today.month, today.day)
+        return tuple((current_date - timedelta(weeks=i)).strftime("%Y-W%U") for i in range(4, 0, -1))
+    if period == "month":
+        months = today.year * 12 + today.month - 1
+        return tuple(
+            f"{(months - i) // 12}-{(months - i) % 12 + 1:02d}"
+            for i in range(4, 0, -1)
+        )
+    if period == "quarter":
+        quarters = today.year * 4 + (today.month - 1) // 3
+        return tuple(
+            f"{(quarters - i) // 4}-{_QS[(quarters - i) % 4]}"
+            for i in range(4, 0, -1)
+        )
+    raise ValueError(f"Unsupported period: {period}")
 
 
 async def trend_analysis_impl(arguments: Dict):
@@ -446,24 +563,15 @@ async def trend_analysis_impl(arguments: Dict):
     
     # Mock trend data for demo
     current_date = datetime.now()
-    
-    if period == "week":
-        periods = [(current_date - timedelta(weeks=i)).strftime("%Y-W%U") for i in range(4, 0, -1)]
-    elif period == "month":
-        periods = [(current_date - timedelta(days=30*i)).strftime("%Y-%m") for i in range(4, 0, -1)]
-    elif period == "quarter":
-        periods = [f"{current_date.year}-Q{((current_date.month-1)//3 + 1 - i) % 4 + 1}" for i in range(4, 0, -1)]
-    else:
-        raise ValueError(f"Unsupported period: {period}")
+    periods = _trend_periods(period, current_date.date())
     
     # Generate mock trend data
-    import random
     base_value = {"customers": 100, "revenue": 10000, "engagement": 0.7}[metric]
     
     trend_data = []
     for i, period_label in enumerate(periods):
         # Simulate realistic growth/decline
-        multiplier = 1 + (i * 0.1) + random.uniform(-0.05, 0.15)
+        multiplier = 1 + (i * 0.1) + _trend_rng.uniform(-0.05, 0.15)
         value = round(base_value * multiplier, 2)
         
         trend_data.append({
@@ -492,16 +600,32 @@ async def trend_analysis_impl(arguments: Dict):
         "trend_direction": trend_direction,
         "change_percent": round(change_percent, 1) if len(trend_data) >= 2 else 0,
         "data_points": trend_data,
-        "analysis_date": current_date.isoformat()
+        "analysis_date": now_iso()
     }
 
 
+# Dispatch table for tools/call: one dict lookup instead of a string
+# comparison cascade, and new tools register here in one line.
+_TOOLS = {
+    "customer_analytics": customer_analytics_impl,
+    "company_analytics": company_analytics_impl,
+    "generate_report": generate_report_impl,
+    "trend_analysis": trend_analysis_impl,
+}
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 3002))
+    # One process per core by default (override with WEB_CONCURRENCY);
+    # worker processes sidestep the GIL for the CPU-bound metric paths.
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
     uvicorn.run(
         "analytics_server:app",
         host="0.0.0.0",
         port=port,
         reload=False,
-        log_level="info"
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
     )
\ No newline at end of file
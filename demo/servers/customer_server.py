@@ -6,15 +6,22 @@ Provides CRUD operations for customer data with authentication.
 
 import asyncio
 import sqlite3
+import hmac
 import json
 import os
+import time
+
+import aiosqlite
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
 
@@ -43,6 +50,15 @@ class CustomerUpdate(BaseModel):
     company: Optional[str] = None
 
 
+class MCPRequest(BaseModel):
+    """JSON-RPC 2.0 envelope for the MCP endpoint, validated once by
+    Pydantic instead of being pulled apart by hand from a raw dict."""
+    jsonrpc: str = "2.0"
+    id: Union[str, int] = "unknown"
+    method: str
+    params: Dict = {}
+
+
 # Database setup
 DB_FILE = os.getenv('DB_FILE', '/tmp/customers.db')
 
@@ -62,6 +78,12 @@ def init_db():
         )
     ''')
     
+    # Covers the company filter + created_at ordering in list_customers
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_customers_company_created "
+        "ON customers(company, created_at DESC)"
+    )
+    
     # Insert sample data
     sample_customers = [
         ("John Smith", "john.smith@example.com", "+1-555-0001", "Acme Corp"),
@@ -82,13 +104,20 @@ def init_db():
     conn.close()
 
 
-# Authentication
+# Shared database connection; opened once at startup so requests stop
+# paying a connect/close per query, with WAL mode for concurrent readers.
+db: Optional[aiosqlite.Connection] = None
+
+
+# Authentication. The expected token is resolved once at import (env
+# override for non-demo deployments) and compared in constant time.
 security = HTTPBearer()
+_EXPECTED_TOKEN = os.getenv("MCP_TOKEN", "demo-token-12345").encode()
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Simple token verification for demo purposes."""
     # In production, this would validate a real JWT token
-    if credentials.credentials != "demo-token-12345":
+    if not hmac.compare_digest(credentials.credentials.encode(), _EXPECTED_TOKEN):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
@@ -100,24 +129,128 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    global db
     init_db()
+    db = await aiosqlite.connect(DB_FILE)
+    db.row_factory = aiosqlite.Row
+    await db.execute("PRAGMA journal_mode=WAL")
+    await db.execute("PRAGMA synchronous=NORMAL")
     yield
     # Shutdown
-    pass
+    await db.close()
+    db = None
 
 app = FastAPI(
     title="Customer Management API",
     description="MCP Server for customer CRUD operations",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
+# Compress large JSON payloads (analytics responses with per-customer
+# maps compress heavily); small responses skip the middleware entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# The tools/list result is immutable, so build it once at import time
+# instead of re-allocating the schema tree per request.
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "get_customer",
+            "description": "Retrieve customer information by ID",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "customer_id": {"type": "integer", "description": "Customer ID"}
+                },
+                "required": ["customer_id"]
+            }
+        },
+        {
+            "name": "create_customer",
+            "description": "Create a new customer",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Customer name"},
+                    "email": {"type": "string", "description": "Customer email"},
+                    "phone": {"type": "string", "description": "Customer phone"},
+                    "company": {"type": "string", "description": "Customer company"}
+                },
+                "required": ["name", "email"]
+            }
+        },
+        {
+            "name": "update_customer",
+            "description": "Update existing customer",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "customer_id": {"type": "integer", "description": "Customer ID"},
+                    "name": {"type": "string", "description": "Customer name"},
+                    "email": {"type": "string", "description": "Customer email"},
+                    "phone": {"type": "string", "description": "Customer phone"},
+                    "company": {"type": "string", "description": "Customer company"}
+                },
+                "required": ["customer_id"]
+            }
+        },
+        {
+            "name": "list_customers",
+            "description": "List all customers with optional filtering",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "limit": {"type": "integer", "description": "Maximum number of results"},
+                    "company": {"type": "string", "description": "Filter by company"}
+                }
+            }
+        },
+        {
+            "name": "get_customers_bulk",
+            "description": "Retrieve multiple customers by ID in one call",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "Customer IDs to fetch"
+                    }
+                },
+                "required": ["ids"]
+            }
+        }
+    ]
+}
+
+
+# Read-through cache for hot read-only tools, keyed on the serialized
+# call and expired by a short per-tool TTL. The cache is in-process,
+# which is only sound with a single worker: with several workers a
+# write handled by one process cannot flush its siblings' caches, so
+# their reads could stay stale for a full TTL. Since __main__ defaults
+# to one worker per core, the cache enables itself only when that same
+# calculation yields a single worker; a shared cache (e.g. Redis, or
+# the WAL SQLite store) would be the cross-process answer.
+_WORKER_COUNT = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+_READ_TOOL_TTLS = (
+    {"get_customer": 30.0, "list_customers": 10.0} if _WORKER_COUNT == 1 else {}
 )
+_read_cache: Dict[bytes, tuple] = {}
 
 
-# Database helper functions
-def get_db():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _read_cache_get(key: bytes):
+    entry = _read_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _read_cache_put(key: bytes, result, ttl: float):
+    _read_cache[key] = (time.monotonic() + ttl, result)
 
 
 # API Endpoints
@@ -128,88 +261,47 @@ async def health_check():
 
 
 @app.post("/mcp", dependencies=[Depends(verify_token)])
-async def mcp_endpoint(request: Dict):
+async def mcp_endpoint(request: MCPRequest):
     """MCP protocol endpoint."""
-    method = request.get("method")
-    params = request.get("params", {})
-    request_id = request.get("id", "unknown")
+    method = request.method
+    params = request.params
+    request_id = request.id
     
     try:
         if method == "tools/list":
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "get_customer",
-                            "description": "Retrieve customer information by ID",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "customer_id": {"type": "integer", "description": "Customer ID"}
-                                },
-                                "required": ["customer_id"]
-                            }
-                        },
-                        {
-                            "name": "create_customer",
-                            "description": "Create a new customer",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Customer name"},
-                                    "email": {"type": "string", "description": "Customer email"},
-                                    "phone": {"type": "string", "description": "Customer phone"},
-                                    "company": {"type": "string", "description": "Customer company"}
-                                },
-                                "required": ["name", "email"]
-                            }
-                        },
-                        {
-                            "name": "update_customer",
-                            "description": "Update existing customer",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "customer_id": {"type": "integer", "description": "Customer ID"},
-                                    "name": {"type": "string", "description": "Customer name"},
-                                    "email": {"type": "string", "description": "Customer email"},
-                                    "phone": {"type": "string", "description": "Customer phone"},
-                                    "company": {"type": "string", "description": "Customer company"}
-                                },
-                                "required": ["customer_id"]
-                            }
-                        },
-                        {
-                            "name": "list_customers",
-                            "description": "List all customers with optional filtering",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "limit": {"type": "integer", "description": "Maximum number of results"},
-                                    "company": {"type": "string", "description": "Filter by company"}
-                                }
-                            }
-                        }
-                    ]
-                }
+                "result": TOOLS_LIST_RESULT
             }
         
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
-            if tool_name == "get_customer":
-                result = await get_customer_impl(arguments.get("customer_id"))
-            elif tool_name == "create_customer":
-                result = await create_customer_impl(arguments)
-            elif tool_name == "update_customer":
-                result = await update_customer_impl(arguments)
-            elif tool_name == "list_customers":
-                result = await list_customers_impl(arguments)
-            else:
+            cache_key = None
+            ttl = _READ_TOOL_TTLS.get(tool_name)
+            if ttl is not None:
+                cache_key = orjson.dumps(
+                    (tool_name, arguments), option=orjson.OPT_SORT_KEYS
+                )
+                cached = _read_cache_get(cache_key)
+                if cached is not None:
+                    return {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "result": cached
+                    }
+            
+            impl = _TOOLS.get(tool_name)
+            if impl is None:
                 raise ValueError(f"Unknown tool: {tool_name}")
+            result = await impl(arguments)
+            if tool_name in _WRITE_TOOLS:
+                _read_cache.clear()
+            
+            if cache_key is not None:
+                _read_cache_put(cache_key, result, ttl)
             
             return {
                 "jsonrpc": "2.0",
@@ -234,10 +326,8 @@ async def mcp_endpoint(request: Dict):
 # Tool implementations
 async def get_customer_impl(customer_id: int):
     """Get customer by ID."""
-    conn = get_db()
-    cursor = conn.execute("SELECT * FROM customers WHERE id = ?", (customer_id,))
-    row = cursor.fetchone()
-    conn.close()
+    async with db.execute("SELECT * FROM customers WHERE id = ?", (customer_id,)) as cursor:
+        row = await cursor.fetchone()
     
     if not row:
         raise ValueError(f"Customer {customer_id} not found")
@@ -247,9 +337,8 @@ async def get_customer_impl(customer_id: int):
 
 async def create_customer_impl(customer_data: Dict):
     """Create new customer."""
-    conn = get_db()
     try:
-        cursor = conn.execute(
+        cursor = await db.execute(
             "INSERT INTO customers (name, email, phone, company) VALUES (?, ?, ?, ?)",
             (
                 customer_data["name"],
@@ -259,13 +348,12 @@ async def create_customer_impl(customer_data: Dict):
             )
         )
         customer_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        await db.commit()
         
         return await get_customer_impl(customer_id)
     
     except sqlite3.IntegrityError as e:
-        conn.close()
+        await db.rollback()
         raise ValueError(f"Customer creation failed: {e}")
 
 
@@ -290,57 +378,86 @@ async def update_customer_impl(update_data: Dict):
     fields.append("updated_at = CURRENT_TIMESTAMP")
     values.append(customer_id)
     
-    conn = get_db()
-    cursor = conn.execute(
+    cursor = await db.execute(
         f"UPDATE customers SET {', '.join(fields)} WHERE id = ?",
         values
     )
     
     if cursor.rowcount == 0:
-        conn.close()
+        await db.rollback()
         raise ValueError(f"Customer {customer_id} not found")
     
-    conn.commit()
-    conn.close()
+    await db.commit()
     
     return await get_customer_impl(customer_id)
 
 
+# Precomputed statements let SQLite reuse the compiled plan instead of
+# re-parsing dynamically assembled SQL per request.
+LIST_CUSTOMERS_SQL = "SELECT * FROM customers ORDER BY created_at DESC LIMIT ?"
+LIST_CUSTOMERS_BY_COMPANY_SQL = (
+    "SELECT * FROM customers WHERE company = ? ORDER BY created_at DESC LIMIT ?"
+)
+
+
+async def get_customers_bulk_impl(arguments: Dict):
+    """Fetch multiple customers in a single query."""
+    ids = arguments.get("ids") or []
+    if not ids:
+        return []
+    
+    placeholders = ",".join("?" * len(ids))
+    rows = await db.execute_fetchall(
+        f"SELECT * FROM customers WHERE id IN ({placeholders})", ids
+    )
+    
+    return [dict(row) for row in rows]
+
+
 async def list_customers_impl(filters: Dict):
     """List customers with optional filtering."""
-    query = "SELECT * FROM customers"
-    params = []
-    conditions = []
+    limit = filters.get("limit", 100)
     
-    # Apply filters
     if filters.get("company"):
-        conditions.append("company = ?")
-        params.append(filters["company"])
-    
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
-    
-    query += " ORDER BY created_at DESC"
+        query = LIST_CUSTOMERS_BY_COMPANY_SQL
+        params = (filters["company"], limit)
+    else:
+        query = LIST_CUSTOMERS_SQL
+        params = (limit,)
     
-    # Apply limit
-    limit = filters.get("limit", 100)
-    query += " LIMIT ?"
-    params.append(limit)
-    
-    conn = get_db()
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
+    async with db.execute(query, params) as cursor:
+        rows = await cursor.fetchall()
     
     return [dict(row) for row in rows]
 
 
+# Dispatch table for tools/call: one dict lookup instead of a string
+# comparison cascade, and new tools register here in one line. Write
+# tools additionally flush the read cache above.
+_TOOLS = {
+    "get_customer": lambda args: get_customer_impl(args.get("customer_id")),
+    "create_customer": create_customer_impl,
+    "update_customer": update_customer_impl,
+    "list_customers": list_customers_impl,
+    "get_customers_bulk": get_customers_bulk_impl,
+}
+_WRITE_TOOLS = frozenset({"create_customer", "update_customer"})
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 3001))
+    # One process per core by default (override with WEB_CONCURRENCY);
+    # worker processes sidestep the GIL for the CPU-bound paths, and the
+    # SQLite WAL mode set at startup allows concurrent readers. The
+    # read cache above keys off the same worker count.
+    workers = _WORKER_COUNT
     uvicorn.run(
         "customer_server:app",
         host="0.0.0.0",
         port=port,
         reload=False,
-        log_level="info"
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
     )
\ No newline at end of file
@@ -5,25 +5,33 @@ Provides email, Slack, and webhook notification capabilities.
 """
 
 import asyncio
+import hmac
 import json
 import os
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
+from uuid import uuid4
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends, status
+import aiosqlite
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import uvicorn
 import httpx
+import orjson
 
 
-# Authentication
+# Authentication. The expected token is resolved once at import (env
+# override for non-demo deployments) and compared in constant time.
 security = HTTPBearer()
+_EXPECTED_TOKEN = os.getenv("MCP_TOKEN", "demo-token-12345").encode()
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Simple token verification for demo purposes."""
-    if credentials.credentials != "demo-token-12345":
+    if not hmac.compare_digest(credentials.credentials.encode(), _EXPECTED_TOKEN):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
@@ -31,27 +39,165 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     return credentials.credentials
 
 
+class MCPRequest(BaseModel):
+    """JSON-RPC 2.0 envelope for the MCP endpoint, validated once by
+    Pydantic instead of being pulled apart by hand from a raw dict."""
+    jsonrpc: str = "2.0"
+    id: Union[str, int] = "unknown"
+    method: str
+    params: Dict = {}
+
+
+# Shared HTTP client with keep-alive pooling; created in lifespan so
+# every webhook send reuses warm connections instead of rebuilding a
+# pool (and paying TCP/TLS setup) per call.
+http_client: Optional[httpx.AsyncClient] = None
+
+# Notification log lives in SQLite (WAL mode) so the status endpoint
+# stays consistent when uvicorn runs multiple worker processes; a
+# per-worker in-memory log would diverge. WAL allows concurrent readers
+# across workers.
+LOG_DB_FILE = os.getenv("NOTIFICATIONS_DB_FILE", "/tmp/notifications.db")
+LOG_MAX_ENTRIES = 1000
+log_db: Optional[aiosqlite.Connection] = None
+
+
+async def _open_log_db() -> aiosqlite.Connection:
+    conn = await aiosqlite.connect(LOG_DB_FILE)
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("PRAGMA journal_mode=WAL")
+    await conn.execute("PRAGMA synchronous=NORMAL")
+    await conn.execute("PRAGMA busy_timeout=5000")
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS notification_log (
+            id TEXT PRIMARY KEY,
+            type TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            status TEXT NOT NULL,
+            config TEXT,
+            error TEXT
+        )
+    ''')
+    await conn.commit()
+    return conn
+
+
 # FastAPI app setup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    global http_client, log_db
+    http_client = httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+    )
+    log_db = await _open_log_db()
     yield
     # Shutdown
-    pass
+    await http_client.aclose()
+    await log_db.close()
 
 app = FastAPI(
     title="Notifications API",
     description="MCP Server for email, Slack, and webhook notifications",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configuration
 SMTP_SERVER = os.getenv("SMTP_SERVER", "localhost")
 SMTP_PORT = int(os.getenv("SMTP_PORT", 1025))
 
-# In-memory storage for demo purposes
-notification_log = []
+# tools/list never changes, so the result tree is built once at import
+# time instead of from literals on every request.
+TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "send_email",
+            "description": "Send email notification",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "to": {"type": "string", "description": "Recipient email address"},
+                    "subject": {"type": "string", "description": "Email subject"},
+                    "body": {"type": "string", "description": "Email body (HTML or text)"},
+                    "from": {"type": "string", "description": "Sender email address"},
+                    "cc": {"type": "array", "items": {"type": "string"}, "description": "CC recipients"},
+                    "bcc": {"type": "array", "items": {"type": "string"}, "description": "BCC recipients"}
+                },
+                "required": ["to", "subject", "body"]
+            }
+        },
+        {
+            "name": "send_slack_message",
+            "description": "Send message to Slack channel or user",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "channel": {"type": "string", "description": "Slack channel or user ID"},
+                    "message": {"type": "string", "description": "Message content"},
+                    "username": {"type": "string", "description": "Bot username"},
+                    "emoji": {"type": "string", "description": "Bot emoji"},
+                    "attachments": {"type": "array", "description": "Message attachments"}
+                },
+                "required": ["channel", "message"]
+            }
+        },
+        {
+            "name": "send_webhook",
+            "description": "Send webhook notification",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "description": "Webhook URL"},
+                    "payload": {"type": "object", "description": "Webhook payload"},
+                    "headers": {"type": "object", "description": "Custom headers"},
+                    "method": {
+                        "type": "string",
+                        "enum": ["POST", "PUT", "PATCH"],
+                        "description": "HTTP method"
+                    }
+                },
+                "required": ["url", "payload"]
+            }
+        },
+        {
+            "name": "send_bulk_notifications",
+            "description": "Send notifications to multiple recipients",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "notifications": {
+                        "type": "array",
+                        "description": "List of notifications to send",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "type": {"type": "string", "enum": ["email", "slack", "webhook"]},
+                                "config": {"type": "object", "description": "Type-specific configuration"}
+                            }
+                        }
+                    },
+                    "batch_size": {"type": "integer", "description": "Batch processing size"},
+                    "delay_ms": {"type": "integer", "description": "Delay between batches in milliseconds"}
+                },
+                "required": ["notifications"]
+            }
+        },
+        {
+            "name": "get_notification_status",
+            "description": "Get status of sent notifications",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "notification_id": {"type": "string", "description": "Specific notification ID"},
+                    "limit": {"type": "integer", "description": "Number of recent notifications to return"}
+                }
+            }
+        }
+    ]
+}
 
 
 # API Endpoints
@@ -62,122 +208,53 @@ async def health_check():
 
 
 @app.post("/mcp", dependencies=[Depends(verify_token)])
-async def mcp_endpoint(request: Dict):
+async def mcp_endpoint(request: MCPRequest, background: BackgroundTasks):
     """MCP protocol endpoint."""
-    method = request.get("method")
-    params = request.get("params", {})
-    request_id = request.get("id", "unknown")
+    method = request.method
+    params = request.params
+    request_id = request.id
     
     try:
         if method == "tools/list":
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
-                "result": {
-                    "tools": [
-                        {
-                            "name": "send_email",
-                            "description": "Send email notification",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "to": {"type": "string", "description": "Recipient email address"},
-                                    "subject": {"type": "string", "description": "Email subject"},
-                                    "body": {"type": "string", "description": "Email body (HTML or text)"},
-                                    "from": {"type": "string", "description": "Sender email address"},
-                                    "cc": {"type": "array", "items": {"type": "string"}, "description": "CC recipients"},
-                                    "bcc": {"type": "array", "items": {"type": "string"}, "description": "BCC recipients"}
-                                },
-                                "required": ["to", "subject", "body"]
-                            }
-                        },
-                        {
-                            "name": "send_slack_message",
-                            "description": "Send message to Slack channel or user",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "channel": {"type": "string", "description": "Slack channel or user ID"},
-                                    "message": {"type": "string", "description": "Message content"},
-                                    "username": {"type": "string", "description": "Bot username"},
-                                    "emoji": {"type": "string", "description": "Bot emoji"},
-                                    "attachments": {"type": "array", "description": "Message attachments"}
-                                },
-                                "required": ["channel", "message"]
-                            }
-                        },
-                        {
-                            "name": "send_webhook",
-                            "description": "Send webhook notification",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "url": {"type": "string", "description": "Webhook URL"},
-                                    "payload": {"type": "object", "description": "Webhook payload"},
-                                    "headers": {"type": "object", "description": "Custom headers"},
-                                    "method": {
-                                        "type": "string",
-                                        "enum": ["POST", "PUT", "PATCH"],
-                                        "description": "HTTP method"
-                                    }
-                                },
-                                "required": ["url", "payload"]
-                            }
-                        },
-                        {
-                            "name": "send_bulk_notifications",
-                            "description": "Send notifications to multiple recipients",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "notifications": {
-                                        "type": "array",
-                                        "description": "List of notifications to send",
-                                        "items": {
-                                            "type": "object",
-                                            "properties": {
-                                                "type": {"type": "string", "enum": ["email", "slack", "webhook"]},
-                                                "config": {"type": "object", "description": "Type-specific configuration"}
-                                            }
-                                        }
-                                    },
-                                    "batch_size": {"type": "integer", "description": "Batch processing size"},
-                                    "delay_ms": {"type": "integer", "description": "Delay between batches in milliseconds"}
-                                },
-                                "required": ["notifications"]
-                            }
-                        },
-                        {
-                            "name": "get_notification_status",
-                            "description": "Get status of sent notifications",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "notification_id": {"type": "string", "description": "Specific notification ID"},
-                                    "limit": {"type": "integer", "description": "Number of recent notifications to return"}
-                                }
-                            }
-                        }
-                    ]
-                }
+                "result": TOOLS_LIST_RESULT
             }
         
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
             
-            if tool_name == "send_email":
-                result = await send_email_impl(arguments)
-            elif tool_name == "send_slack_message":
-                result = await send_slack_message_impl(arguments)
-            elif tool_name == "send_webhook":
-                result = await send_webhook_impl(arguments)
-            elif tool_name == "send_bulk_notifications":
-                result = await send_bulk_notifications_impl(arguments)
-            elif tool_name == "get_notification_status":
-                result = await get_notification_status_impl(arguments)
-            else:
+            # History queries can return up to 1000 entries; stream them
+            # row by row so the response needs constant memory and the
+            # first bytes go out before the last row is serialized.
+            if (tool_name == "get_notification_status"
+                    and not arguments.get("notification_id")):
+                return StreamingResponse(
+                    _stream_status_response(request_id, arguments.get("limit", 50)),
+                    media_type="application/json"
+                )
+            
+            # Email and Slack sends are fire-and-forget: the caller
+            # gets the id right away and the send itself runs after the
+            # response has been flushed.
+            if tool_name in _BACKGROUND_TOOLS:
+                notif_id = generate_notification_id()
+                background.add_task(_TOOLS[tool_name], arguments, notif_id)
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": {
+                        "notification_id": notif_id,
+                        "status": "queued"
+                    }
+                }
+            
+            impl = _TOOLS.get(tool_name)
+            if impl is None:
                 raise ValueError(f"Unknown tool: {tool_name}")
+            result = await impl(arguments)
             
             return {
                 "jsonrpc": "2.0",
@@ -202,31 +279,44 @@ async def mcp_endpoint(request: Dict):
 # Utility functions
 def generate_notification_id() -> str:
     """Generate unique notification ID."""
-    import uuid
-    return str(uuid.uuid4())
+    return uuid4().hex
 
 
-def log_notification(notification_type: str, config: Dict, status: str, error: str = None):
+async def log_notification(notification_type: str, config: Dict, status: str,
+                           error: str = None, timestamp: str = None,
+                           notification_id: str = None):
     """Log notification attempt."""
-    log_entry = {
-        "id": generate_notification_id(),
-        "type": notification_type,
-        "timestamp": datetime.now().isoformat(),
-        "status": status,
-        "config": config,
-        "error": error
-    }
-    notification_log.append(log_entry)
-    
-    # Keep only last 1000 entries
-    if len(notification_log) > 1000:
-        notification_log.pop(0)
+    if notification_id is None:
+        notification_id = generate_notification_id()
+    await log_db.execute(
+        "INSERT INTO notification_log (id, type, timestamp, status, config, error) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (notification_id, notification_type, timestamp or datetime.now().isoformat(),
+         status, json.dumps(config), error)
+    )
+    # Keep the log bounded; rowid ordering makes the trim O(removed).
+    await log_db.execute(
+        "DELETE FROM notification_log WHERE rowid <= last_insert_rowid() - ?",
+        (LOG_MAX_ENTRIES,)
+    )
+    await log_db.commit()
     
-    return log_entry["id"]
+    return notification_id
+
+
+def _row_to_entry(row: aiosqlite.Row) -> Dict:
+    return {
+        "id": row["id"],
+        "type": row["type"],
+        "timestamp": row["timestamp"],
+        "status": row["status"],
+        "config": json.loads(row["config"]) if row["config"] else None,
+        "error": row["error"]
+    }
 
 
 # Tool implementations
-async def send_email_impl(arguments: Dict):
+async def send_email_impl(arguments: Dict, notification_id: str = None):
     """Send email notification (mock implementation for demo)."""
     to = arguments["to"]
     subject = arguments["subject"]
@@ -235,14 +325,17 @@ async def send_email_impl(arguments: Dict):
     cc = arguments.get("cc", [])
     bcc = arguments.get("bcc", [])
     
+    # One clock read + format per request, reused for log and response
+    now_iso = datetime.now().isoformat()
+    
     # Mock email sending for demo
-    notification_id = log_notification("email", {
+    notification_id = await log_notification("email", {
         "to": to,
         "from": from_addr,
         "subject": subject,
         "cc": cc,
         "bcc": bcc
-    }, "sent")
+    }, "sent", timestamp=now_iso, notification_id=notification_id)
     
     # In a real implementation, you would:
     # 1. Connect to SMTP server
@@ -254,13 +347,13 @@ async def send_email_impl(arguments: Dict):
         "notification_id": notification_id,
         "status": "sent",
         "recipients": [to] + cc + bcc,
-        "sent_at": datetime.now().isoformat(),
+        "sent_at": now_iso,
         "provider": "demo-smtp",
         "message": f"Email sent to {to} with subject '{subject}'"
     }
 
 
-async def send_slack_message_impl(arguments: Dict):
+async def send_slack_message_impl(arguments: Dict, notification_id: str = None):
     """Send Slack message (mock implementation for demo)."""
     channel = arguments["channel"]
     message = arguments["message"]
@@ -268,12 +361,15 @@ async def send_slack_message_impl(arguments: Dict):
     emoji = arguments.get("emoji", ":robot_face:")
     attachments = arguments.get("attachments", [])
     
+    now = datetime.now()
+    now_iso = now.isoformat()
+    
     # Mock Slack API call for demo
-    notification_id = log_notification("slack", {
+    notification_id = await log_notification("slack", {
         "channel": channel,
         "username": username,
         "emoji": emoji
-    }, "sent")
+    }, "sent", timestamp=now_iso, notification_id=notification_id)
     
     # In a real implementation, you would:
     # 1. Make HTTP request to Slack Web API
@@ -285,8 +381,8 @@ async def send_slack_message_impl(arguments: Dict):
         "notification_id": notification_id,
         "status": "sent",
         "channel": channel,
-        "message_ts": str(datetime.now().timestamp()),
-        "sent_at": datetime.now().isoformat(),
+        "message_ts": str(now.timestamp()),
+        "sent_at": now_iso,
         "bot_id": "demo-bot",
         "message": f"Slack message sent to {channel}"
     }
@@ -309,46 +405,70 @@ async def send_webhook_impl(arguments: Dict):
         }
         default_headers.update(headers)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                json=payload,
-                headers=default_headers
-            )
-            
-            log_notification("webhook", {
-                "url": url,
-                "method": method,
-                "status_code": response.status_code
-            }, "sent" if response.status_code < 400 else "error")
-            
-            return {
-                "notification_id": notification_id,
-                "status": "sent" if response.status_code < 400 else "error",
-                "status_code": response.status_code,
-                "sent_at": datetime.now().isoformat(),
-                "response_headers": dict(response.headers),
-                "url": url,
-                "message": f"Webhook {method} to {url} returned {response.status_code}"
-            }
+        response = await http_client.request(
+            method=method,
+            url=url,
+            json=payload,
+            headers=default_headers
+        )
+        
+        now_iso = datetime.now().isoformat()
+        await log_notification("webhook", {
+            "url": url,
+            "method": method,
+            "status_code": response.status_code
+        }, "sent" if response.status_code < 400 else "error", timestamp=now_iso)
+        
+        return {
+            "notification_id": notification_id,
+            "status": "sent" if response.status_code < 400 else "error",
+            "status_code": response.status_code,
+            "sent_at": now_iso,
+            "response_headers": dict(response.headers),
+            "url": url,
+            "message": f"Webhook {method} to {url} returned {response.status_code}"
+        }
     
     except Exception as e:
-        log_notification("webhook", {
+        now_iso = datetime.now().isoformat()
+        await log_notification("webhook", {
             "url": url,
             "method": method
-        }, "error", str(e))
+        }, "error", str(e), timestamp=now_iso)
         
         return {
             "notification_id": notification_id,
             "status": "error",
             "error": str(e),
-            "sent_at": datetime.now().isoformat(),
+            "sent_at": now_iso,
             "url": url,
             "message": f"Webhook {method} to {url} failed: {e}"
         }
 
 
+async def _dispatch_notification(notification: Dict, semaphore: asyncio.Semaphore):
+    """Send one notification of any supported type.
+
+    Failures propagate; the bulk caller collects them through
+    gather(return_exceptions=True) rather than per-call try/except.
+    """
+    notification_type = notification["type"]
+    config = notification["config"]
+    
+    async with semaphore:
+        if notification_type == "email":
+            return await send_email_impl(config)
+        elif notification_type == "slack":
+            return await send_slack_message_impl(config)
+        elif notification_type == "webhook":
+            return await send_webhook_impl(config)
+        else:
+            return {
+                "status": "error",
+                "error": f"Unknown notification type: {notification_type}"
+            }
+
+
 async def send_bulk_notifications_impl(arguments: Dict):
     """Send bulk notifications with batching."""
     notifications = arguments["notifications"]
@@ -356,47 +476,36 @@ async def send_bulk_notifications_impl(arguments: Dict):
     delay_ms = arguments.get("delay_ms", 100)
     
     results = []
+    # The semaphore keeps no more than one batch worth of sends in
+    # flight at once for backpressure.
+    semaphore = asyncio.Semaphore(batch_size)
     
-    # Process in batches
+    # Process in batches; sends within a batch run concurrently, so a
+    # batch of network-bound webhooks costs ~one round-trip rather than
+    # one per notification.
     for i in range(0, len(notifications), batch_size):
         batch = notifications[i:i + batch_size]
-        batch_results = []
         
-        # Process batch concurrently
-        for notification in batch:
-            notification_type = notification["type"]
-            config = notification["config"]
-            
-            try:
-                if notification_type == "email":
-                    result = await send_email_impl(config)
-                elif notification_type == "slack":
-                    result = await send_slack_message_impl(config)
-                elif notification_type == "webhook":
-                    result = await send_webhook_impl(config)
-                else:
-                    result = {
-                        "status": "error",
-                        "error": f"Unknown notification type: {notification_type}"
-                    }
-                
-                batch_results.append(result)
-                
-            except Exception as e:
-                batch_results.append({
-                    "status": "error",
-                    "error": str(e),
-                    "type": notification_type
-                })
-        
-        results.extend(batch_results)
+        batch_results = await asyncio.gather(
+            *(_dispatch_notification(n, semaphore) for n in batch),
+            return_exceptions=True
+        )
+        results.extend(
+            r if not isinstance(r, Exception) else {
+                "status": "error",
+                "error": str(r),
+                "type": n.get("type")
+            }
+            for r, n in zip(batch_results, batch)
+        )
         
         # Delay between batches
         if delay_ms > 0 and i + batch_size < len(notifications):
             await asyncio.sleep(delay_ms / 1000)
     
-    # Calculate summary statistics
-    sent_count = sum(1 for r in results if r.get("status") == "sent")
+    # Calculate summary statistics in one pass over the results
+    status_counts = Counter(r.get("status", "error") for r in results)
+    sent_count = status_counts.get("sent", 0)
     error_count = len(results) - sent_count
     
     return {
@@ -409,6 +518,43 @@ async def send_bulk_notifications_impl(arguments: Dict):
     }
 
 
+async def _stream_status_response(request_id, limit: int):
+    """Yield a JSON-RPC status response with the entry array streamed."""
+    async with log_db.execute(
+        "SELECT COUNT(*) AS total, "
+        "COALESCE(SUM(status = 'sent'), 0) AS sent FROM notification_log"
+    ) as cursor:
+        stats = await cursor.fetchone()
+    total = stats["total"]
+    sent = stats["sent"]
+    
+    envelope = orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "total_notifications": total,
+            "sent_count": sent,
+            "error_count": total - sent,
+            "success_rate": round((sent / total) * 100, 1) if total > 0 else 0,
+            "retrieved_at": datetime.now().isoformat()
+        }
+    })
+    # Reopen the envelope (strip the two closing braces) and splice the
+    # entry array in as the final result field.
+    yield envelope[:-2] + b',"recent_notifications":['
+    
+    first = True
+    async with log_db.execute(
+        "SELECT * FROM notification_log ORDER BY rowid DESC LIMIT ?", (limit,)
+    ) as cursor:
+        async for row in cursor:
+            chunk = orjson.dumps(_row_to_entry(row))
+            yield chunk if first else b"," + chunk
+            first = False
+    
+    yield b"]}}"
+
+
 async def get_notification_status_impl(arguments: Dict):
     """Get notification status and history."""
     notification_id = arguments.get("notification_id")
@@ -416,19 +562,28 @@ async def get_notification_status_impl(arguments: Dict):
     
     if notification_id:
         # Get specific notification
-        for entry in reversed(notification_log):
-            if entry["id"] == notification_id:
-                return entry
-        
-        raise ValueError(f"Notification {notification_id} not found")
+        async with log_db.execute(
+            "SELECT * FROM notification_log WHERE id = ?", (notification_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            raise ValueError(f"Notification {notification_id} not found")
+        return _row_to_entry(row)
     
     else:
-        # Get recent notifications
-        recent_notifications = notification_log[-limit:] if notification_log else []
+        # Get recent notifications plus summary counts in two queries
+        async with log_db.execute(
+            "SELECT * FROM notification_log ORDER BY rowid DESC LIMIT ?", (limit,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        async with log_db.execute(
+            "SELECT COUNT(*) AS total, "
+            "COALESCE(SUM(status = 'sent'), 0) AS sent FROM notification_log"
+        ) as cursor:
+            stats = await cursor.fetchone()
         
-        # Calculate summary statistics
-        total = len(notification_log)
-        sent = sum(1 for entry in notification_log if entry["status"] == "sent")
+        total = stats["total"]
+        sent = stats["sent"]
         errors = total - sent
         
         return {
@@ -436,17 +591,38 @@ async def get_notification_status_impl(arguments: Dict):
             "sent_count": sent,
             "error_count": errors,
             "success_rate": round((sent / total) * 100, 1) if total > 0 else 0,
-            "recent_notifications": list(reversed(recent_notifications)),
+            "recent_notifications": [_row_to_entry(r) for r in rows],
             "retrieved_at": datetime.now().isoformat()
         }
 
 
+# Dispatch table for tools/call: one dict lookup instead of a string
+# comparison cascade, and new tools register here in one line.
+_TOOLS = {
+    "send_email": send_email_impl,
+    "send_slack_message": send_slack_message_impl,
+    "send_webhook": send_webhook_impl,
+    "send_bulk_notifications": send_bulk_notifications_impl,
+    "get_notification_status": get_notification_status_impl,
+}
+# Tools whose result doesn't depend on provider latency; dispatched via
+# BackgroundTasks so the response returns as soon as the id exists.
+_BACKGROUND_TOOLS = frozenset({"send_email", "send_slack_message"})
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 3003))
+    # One process per core by default (override with WEB_CONCURRENCY);
+    # the notification log lives in shared WAL-mode SQLite, so all
+    # workers see the same history.
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
     uvicorn.run(
         "notifications_server:app",
         host="0.0.0.0",
         port=port,
         reload=False,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
\ No newline at end of file
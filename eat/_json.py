@@ -0,0 +1,40 @@
+"""
+Internal JSON helpers: orjson when available, stdlib json otherwise.
+
+orjson parses and serializes catalog-sized payloads several times faster
+than stdlib json, but stays an optional accelerator so the core package
+gains no hard dependency.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json still works
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps_str(obj) -> str:
+        """Serialize to a JSON string (aiohttp json_serialize hook)."""
+        return orjson.dumps(obj).decode()
+else:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return json.dumps(obj).encode()
+
+    def dumps_str(obj) -> str:
+        """Serialize to a JSON string (aiohttp json_serialize hook)."""
+        return json.dumps(obj)
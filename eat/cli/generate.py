@@ -2,14 +2,29 @@
 Catalog generation functionality.
 """
 
+import asyncio
 import json
 import os
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+
+import aiofiles
 import click
 
-from ..security import CatalogSigner, compute_sha256
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json still works
+    orjson = None
+
+try:
+    # libyaml-backed loader; ~10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from ..security import CatalogSigner, compute_sha256, compute_sha256_file
 
 
 async def generate_catalog(
@@ -30,8 +45,13 @@ async def generate_catalog(
     
     click.echo(f"🔍 Scanning {specs_dir} for OpenAPI specifications...")
     
-    # Discover all spec files
-    spec_files = list(specs_dir.glob("*.yaml")) + list(specs_dir.glob("*.yml")) + list(specs_dir.glob("*.json"))
+    # Discover all spec files in one directory pass (three globs would
+    # scan the directory three times); sorted for deterministic output.
+    with os.scandir(specs_dir) as entries:
+        spec_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.is_file() and entry.name.lower().endswith(('.yaml', '.yml', '.json'))
+        )
     
     if not spec_files:
         click.echo("Error: No OpenAPI specification files found in specs/", err=True)
@@ -51,18 +71,42 @@ async def generate_catalog(
         "tools": []
     }
     
-    # Process each spec file
-    for spec_file in spec_files:
+    # Read and hash every spec concurrently; each file is read once and
+    # both the parse and the content hash come from that buffer.
+    loaded = await asyncio.gather(
+        *(_load_and_hash(spec_file) for spec_file in spec_files),
+        return_exceptions=True
+    )
+    
+    # Parsing and extraction are CPU-bound; with enough specs, fan them
+    # out to a process pool so the work scales across cores. Small runs
+    # stay in-process to skip the pool startup cost.
+    loop = asyncio.get_running_loop()
+    pool = (
+        ProcessPoolExecutor(max_workers=os.cpu_count())
+        if len(spec_files) >= _MIN_SPECS_FOR_POOL and (os.cpu_count() or 1) > 1
+        else None
+    )
+    try:
+        extracted = await asyncio.gather(
+            *(
+                _extract_one(loop, pool, spec_file, result)
+                for spec_file, result in zip(spec_files, loaded)
+            ),
+            return_exceptions=True
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    for spec_file, tools in zip(spec_files, extracted):
         click.echo(f"  📄 Processing {spec_file.name}...")
         
-        try:
-            spec_data = load_spec_file(spec_file)
-            tools = extract_tools_from_spec(spec_data, spec_file)
-            catalog["tools"].extend(tools)
-            
-        except Exception as e:
-            click.echo(f"    ❌ Error processing {spec_file.name}: {e}", err=True)
+        if isinstance(tools, Exception):
+            click.echo(f"    ❌ Error processing {spec_file.name}: {tools}", err=True)
             continue
+        
+        catalog["tools"].extend(tools)
     
     click.echo(f"✅ Generated catalog with {len(catalog['tools'])} tools")
     
@@ -83,25 +127,73 @@ async def generate_catalog(
         click.echo(f"✅ Signed catalog written to {output_file}")
     else:
         # Write unsigned catalog
-        with open(output_file, 'w') as f:
-            json.dump(catalog, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(catalog, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(catalog, f, indent=2)
             
         click.echo(f"✅ Catalog written to {output_file}")
 
 
+# Below this many specs, a process pool costs more than it saves.
+_MIN_SPECS_FOR_POOL = 8
+
+
+async def _load_and_hash(spec_file: Path):
+    """Read a spec file once, returning its bytes and content hash."""
+    async with aiofiles.open(spec_file, 'rb') as f:
+        data = await f.read()
+    return data, compute_sha256(data)
+
+
+def _parse_and_extract(spec_bytes: bytes, spec_file: Path, spec_hash: str) -> List[Dict[str, Any]]:
+    """Parse a spec and extract its tools; picklable for pool workers."""
+    spec_data = parse_spec_bytes(spec_bytes, spec_file)
+    return extract_tools_from_spec(spec_data, spec_file, spec_hash)
+
+
+async def _extract_one(loop, pool, spec_file: Path, loaded):
+    """Run parse+extract for one spec, in the pool when one is given."""
+    if isinstance(loaded, Exception):
+        raise loaded
+    spec_bytes, spec_hash = loaded
+    if pool is not None:
+        return await loop.run_in_executor(
+            pool, _parse_and_extract, spec_bytes, spec_file, spec_hash
+        )
+    return _parse_and_extract(spec_bytes, spec_file, spec_hash)
+
+
+def parse_spec_bytes(data: bytes, spec_file: Path) -> Dict[str, Any]:
+    """Parse OpenAPI specification from raw bytes."""
+    if spec_file.suffix.lower() == '.json':
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    return yaml.load(data, Loader=_YamlLoader)
+
+
 def load_spec_file(spec_file: Path) -> Dict[str, Any]:
     """Load OpenAPI specification from file."""
-    with open(spec_file, 'r') as f:
-        if spec_file.suffix.lower() == '.json':
-            return json.load(f)
-        else:
-            return yaml.safe_load(f)
+    return parse_spec_bytes(spec_file.read_bytes(), spec_file)
+
 
+def extract_tools_from_spec(
+    spec_data: Dict[str, Any],
+    spec_file: Path,
+    spec_hash: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Extract tool definitions from OpenAPI specification.
 
-def extract_tools_from_spec(spec_data: Dict[str, Any], spec_file: Path) -> List[Dict[str, Any]]:
-    """Extract tool definitions from OpenAPI specification."""
+    ``spec_hash`` should be the precomputed content hash of the spec
+    file; it is computed here only when the caller did not supply one.
+    """
     tools = []
     
+    if spec_hash is None:
+        spec_hash = compute_sha256_file(spec_file)
+    spec_url = f"file://{spec_file.absolute()}"
+    
     # Get base server URL
     servers = spec_data.get('servers', [])
     base_url = servers[0]['url'] if servers else 'http://localhost:3000'
@@ -118,20 +210,23 @@ def extract_tools_from_spec(spec_data: Dict[str, Any], spec_file: Path) -> List[
             if not mcp_tool_config:
                 continue
                 
+            # One shallow copy plus targeted writes instead of an
+            # unpack-merge that re-copied the block and then overwrote
+            # half its keys.
+            mcp_tool = dict(mcp_tool_config)
+            mcp_tool.setdefault('server_url', base_url)
+            mcp_tool['method'] = method.upper()
+            mcp_tool['path'] = path
+            mcp_tool.setdefault('capabilities', [])
+            mcp_tool.setdefault('examples', [])
+            
             tool = {
                 "name": operation.get('operationId', f"{method}_{path.replace('/', '_').strip('_')}"),
                 "description": operation.get('description', operation.get('summary', '')),
                 "version": spec_data.get('info', {}).get('version', '1.0.0'),
-                "spec_url": f"file://{spec_file.absolute()}",
-                "spec_hash": compute_sha256(spec_file.read_bytes()),
-                "x-mcp-tool": {
-                    **mcp_tool_config,
-                    "server_url": mcp_tool_config.get('server_url', base_url),
-                    "method": method.upper(),
-                    "path": path,
-                    "capabilities": mcp_tool_config.get('capabilities', []),
-                    "examples": mcp_tool_config.get('examples', [])
-                }
+                "spec_url": spec_url,
+                "spec_hash": spec_hash,
+                "x-mcp-tool": mcp_tool
             }
             
             # Add parameter schema
@@ -3,14 +3,71 @@ Development server for testing EAT catalogs locally.
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import mimetypes
+import signal
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
+import aiofiles
+import aiofiles.os
 import click
 from aiohttp import web, web_request
+from multidict import CIMultiDict
 from aiohttp.web_response import Response
 
+from .. import _json
+
+try:
+    import msgpack
+except ImportError:  # optional accelerator; JSON remains the wire default
+    msgpack = None
+
+MSGPACK_CONTENT_TYPE = 'application/vnd.eat.catalog+msgpack'
+
+# Fallback catalog served when the directory has none; encoded once at
+# import so the handler returns prebuilt bytes.
+_MINIMAL_CATALOG = {
+    "version": "1.0",
+    "metadata": {
+        "title": "EAT Development Catalog",
+        "description": "Auto-generated development catalog",
+        "generator": "eat-serve"
+    },
+    "tools": []
+}
+_MINIMAL_CATALOG_BYTES = _json.dumps(_MINIMAL_CATALOG)
+_MINIMAL_CATALOG_PRETTY = json.dumps(_MINIMAL_CATALOG, indent=2).encode()
+_MINIMAL_CATALOG_GZIP = gzip.compress(_MINIMAL_CATALOG_BYTES, compresslevel=6)
+
+# Shared response headers, prebuilt as case-insensitive multidicts so
+# aiohttp can merge them without re-interning keys per request.
+_CATALOG_HEADERS = CIMultiDict({
+    'Access-Control-Allow-Origin': '*',
+    'Cache-Control': 'no-cache',
+    'Vary': 'Accept-Encoding'
+})
+_JSON_FILE_HEADERS = CIMultiDict(_CATALOG_HEADERS)
+_JSON_FILE_HEADERS['Content-Type'] = 'application/json'
+_JWT_FILE_HEADERS = CIMultiDict(_CATALOG_HEADERS)
+_JWT_FILE_HEADERS['Content-Type'] = 'application/jwt'
+
+# Packed catalog bodies cached per path, keyed by the JSON body's ETag so
+# a regenerated catalog is re-packed on its next msgpack request.
+_msgpack_cache = {}
+
+
+def _packed_catalog(path, content: bytes, source_etag: str) -> bytes:
+    """Pack a JSON catalog body as msgpack, reusing the cached encoding."""
+    cached = _msgpack_cache.get(path)
+    if cached is not None and cached[0] == source_etag:
+        return cached[1]
+    packed = msgpack.packb(_json.loads(content), use_bin_type=True)
+    _msgpack_cache[path] = (source_etag, packed)
+    return packed
+
 
 async def serve_catalog(host: str, port: int, directory: str):
     """Serve EAT catalog and related files locally."""
@@ -46,63 +103,127 @@ async def serve_catalog(host: str, port: int, directory: str):
     click.echo(f"")
     click.echo(f"Press Ctrl+C to stop the server")
     
+    # Park until a termination signal instead of polling; an unset Event
+    # never wakes the loop, where the old 1 s sleep loop did constantly.
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Signal handlers are unavailable on some platforms (Windows
+            # event loops); fall back to KeyboardInterrupt propagation.
+            pass
+    
     try:
-        # Keep server running
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
+        await stop_event.wait()
+    finally:
         click.echo(f"\n🛑 Shutting down server...")
         await runner.cleanup()
 
 
-async def catalog_handler(request: web_request.Request) -> Response:
-    """Serve the API catalog."""
+def _weak_etag(body: bytes) -> str:
+    """Weak ETag over the catalog body for conditional GETs."""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:16]}-{len(body)}"'
+
+
+async def catalog_handler(request: web_request.Request) -> web.StreamResponse:
+    """Serve the API catalog, honouring If-None-Match with 304s."""
     directory = request.app['directory']
     
     # Look for catalog file
     catalog_files = ['catalog.json', 'catalog.jwt', 'api-catalog.json', 'api-catalog.jwt']
     
+    accept = request.headers.get('Accept', '')
+    wants_msgpack = msgpack is not None and MSGPACK_CONTENT_TYPE in accept
+    
     for filename in catalog_files:
         catalog_file = directory / filename
-        if catalog_file.exists():
-            content = catalog_file.read_text()
+        try:
+            # Existence check off the event loop; .exists() would block it.
+            await aiofiles.os.stat(catalog_file)
+        except OSError:
+            continue
+        # The msgpack representation has to be encoded in userspace,
+        # so it keeps the buffered path with its own weak ETag.
+        if wants_msgpack and not filename.endswith('.jwt'):
+            content = await _read_cached(catalog_file)
+            if content is None:  # file vanished between stat and read
+                continue
+            content = _packed_catalog(catalog_file, content, _weak_etag(content))
+            etag = _weak_etag(content)
             
-            # Determine content type
-            if filename.endswith('.jwt'):
-                content_type = 'application/jwt'
-            else:
-                content_type = 'application/json'
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status=304, headers={'ETag': etag})
             
             return Response(
-                text=content,
-                content_type=content_type,
-                headers={
-                    'Access-Control-Allow-Origin': '*',
-                    'Cache-Control': 'no-cache'
-                }
+                body=content,
+                content_type=MSGPACK_CONTENT_TYPE,
+                headers={**_CATALOG_HEADERS, 'ETag': etag}
             )
+        
+        # Plain files go out via FileResponse, which sends with
+        # sendfile(2) on Linux (no userspace copy) and handles
+        # If-None-Match/If-Modified-Since itself.
+        if filename.endswith('.jwt'):
+            headers = _JWT_FILE_HEADERS
+        else:
+            headers = _JSON_FILE_HEADERS
+        
+        resp = web.FileResponse(catalog_file, headers=headers)
+        # Catalog JSON compresses 5-10x; negotiation against the
+        # request's Accept-Encoding happens inside aiohttp.
+        resp.enable_compression()
+        return resp
+
+    # Serve the prebuilt minimal catalog if none was found on disk; all
+    # encodings (compact, pretty, gzip) are built once at import.
+    if request.query.get('pretty'):
+        return Response(
+            body=_MINIMAL_CATALOG_PRETTY,
+            content_type='application/json',
+            headers=_CATALOG_HEADERS
+        )
     
-    # Generate minimal catalog if none found
-    minimal_catalog = {
-        "version": "1.0",
-        "metadata": {
-            "title": "EAT Development Catalog",
-            "description": "Auto-generated development catalog",
-            "generator": "eat-serve"
-        },
-        "tools": []
-    }
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        return Response(
+            body=_MINIMAL_CATALOG_GZIP,
+            content_type='application/json',
+            headers={**_CATALOG_HEADERS, 'Content-Encoding': 'gzip'}
+        )
     
     return Response(
-        text=json.dumps(minimal_catalog, indent=2),
+        body=_MINIMAL_CATALOG_BYTES,
         content_type='application/json',
-        headers={
-            'Access-Control-Allow-Origin': '*',
-            'Cache-Control': 'no-cache'
-        }
+        headers=_CATALOG_HEADERS
     )
 
 
+# File contents cached by path as (mtime, bytes) in LRU order; the stat
+# check keeps edits visible while repeat hits skip the disk read.
+_FILE_CACHE: 'OrderedDict[Path, tuple]' = OrderedDict()
+_FILE_CACHE_MAX = 32
+
+
+async def _read_cached(path: Path) -> Optional[bytes]:
+    """Read a file off the event loop, reusing the cache while its mtime holds."""
+    try:
+        st = await aiofiles.os.stat(path)
+    except OSError:
+        return None
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime:
+        _FILE_CACHE.move_to_end(path)
+        return cached[1]
+    async with aiofiles.open(path, 'rb') as f:
+        content = await f.read()
+    _FILE_CACHE[path] = (st.st_mtime, content)
+    _FILE_CACHE.move_to_end(path)
+    while len(_FILE_CACHE) > _FILE_CACHE_MAX:
+        _FILE_CACHE.popitem(last=False)
+    return content
+
+
 async def index_handler(request: web_request.Request) -> Response:
     """Serve the catalog browser interface."""
     directory = request.app['directory']
@@ -111,49 +232,42 @@ async def index_handler(request: web_request.Request) -> Response:
     index_file = directory / 'index.html'
     site_index = directory / 'site' / 'index.html'
     
-    if index_file.exists():
-        return Response(
-            text=index_file.read_text(),
-            content_type='text/html'
-        )
-    elif site_index.exists():
-        return Response(
-            text=site_index.read_text(),
-            content_type='text/html'
-        )
+    for candidate in (index_file, site_index):
+        content = await _read_cached(candidate)
+        if content is not None:
+            return Response(
+                body=content,
+                content_type='text/html'
+            )
     
     # Generate default catalog browser
-    browser_html = generate_catalog_browser(request)
-    
     return Response(
-        text=browser_html,
+        body=generate_catalog_browser(request),
         content_type='text/html'
     )
 
 
-def generate_catalog_browser(request: web_request.Request) -> str:
-    """Generate default catalog browser HTML."""
-    base_url = f"{request.scheme}://{request.host}"
-    
-    return f"""<!DOCTYPE html>
+# Default catalog browser page, built once at import time; the only
+# per-request piece is the base URL spliced in between the two halves.
+_BROWSER_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>EAT Framework - Tool Catalog Browser</title>
     <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        .header {{ background: #2c3e50; color: white; padding: 20px; border-radius: 8px 8px 0 0; }}
-        .content {{ padding: 20px; }}
-        .tool {{ border: 1px solid #ddd; border-radius: 4px; padding: 15px; margin-bottom: 15px; }}
-        .tool-name {{ font-size: 18px; font-weight: bold; color: #2c3e50; margin-bottom: 5px; }}
-        .tool-description {{ color: #666; margin-bottom: 10px; }}
-        .capabilities {{ display: flex; gap: 5px; flex-wrap: wrap; margin-bottom: 10px; }}
-        .capability {{ background: #3498db; color: white; padding: 2px 8px; border-radius: 12px; font-size: 12px; }}
-        .example {{ background: #ecf0f1; padding: 10px; border-radius: 4px; font-family: monospace; font-size: 14px; }}
-        .loading {{ text-align: center; padding: 40px; color: #666; }}
-        .error {{ background: #e74c3c; color: white; padding: 15px; border-radius: 4px; margin-bottom: 20px; }}
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 8px 8px 0 0; }
+        .content { padding: 20px; }
+        .tool { border: 1px solid #ddd; border-radius: 4px; padding: 15px; margin-bottom: 15px; }
+        .tool-name { font-size: 18px; font-weight: bold; color: #2c3e50; margin-bottom: 5px; }
+        .tool-description { color: #666; margin-bottom: 10px; }
+        .capabilities { display: flex; gap: 5px; flex-wrap: wrap; margin-bottom: 10px; }
+        .capability { background: #3498db; color: white; padding: 2px 8px; border-radius: 12px; font-size: 12px; }
+        .example { background: #ecf0f1; padding: 10px; border-radius: 4px; font-family: monospace; font-size: 14px; }
+        .loading { text-align: center; padding: 40px; color: #666; }
+        .error { background: #e74c3c; color: white; padding: 15px; border-radius: 4px; margin-bottom: 20px; }
     </style>
 </head>
 <body>
@@ -169,17 +283,17 @@ def generate_catalog_browser(request: web_request.Request) -> str:
     </div>
 
     <script>
-        async function loadCatalog() {{
-            try {{
-                const response = await fetch('{base_url}/.well-known/api-catalog');
-                if (!response.ok) throw new Error(`HTTP ${{response.status}}: ${{response.statusText}}`);
+        async function loadCatalog() {
+            try {
+                const response = await fetch('{BASE_URL}/.well-known/api-catalog');
+                if (!response.ok) throw new Error(`HTTP ${response.status}: ${response.statusText}`);
                 
                 const catalog = await response.json();
                 displayCatalog(catalog);
-            }} catch (error) {{
+            } catch (error) {
                 document.getElementById('status').innerHTML = `
                     <div class="error">
-                        <strong>Error loading catalog:</strong> ${{error.message}}
+                        <strong>Error loading catalog:</strong> ${error.message}
                         <br><br>
                         <strong>Troubleshooting:</strong>
                         <ul style="text-align: left; display: inline-block;">
@@ -189,40 +303,47 @@ def generate_catalog_browser(request: web_request.Request) -> str:
                         </ul>
                     </div>
                 `;
-            }}
-        }}
+            }
+        }
 
-        function displayCatalog(catalog) {{
+        function displayCatalog(catalog) {
             const statusDiv = document.getElementById('status');
             const toolsDiv = document.getElementById('tools');
             
-            if (!catalog.tools || catalog.tools.length === 0) {{
+            if (!catalog.tools || catalog.tools.length === 0) {
                 statusDiv.innerHTML = '<div class="error">No tools found in catalog. Add OpenAPI specs with x-mcp-tool extensions to the specs/ directory.</div>';
                 return;
-            }}
+            }
             
-            statusDiv.innerHTML = `<p>✅ Loaded ${{catalog.tools.length}} tools from catalog</p>`;
+            statusDiv.innerHTML = `<p>✅ Loaded ${catalog.tools.length} tools from catalog</p>`;
             
             toolsDiv.innerHTML = catalog.tools.map(tool => `
                 <div class="tool">
-                    <div class="tool-name">${{tool.name}}</div>
-                    <div class="tool-description">${{tool.description || 'No description available'}}</div>
-                    ${{tool['x-mcp-tool']?.capabilities ? `
+                    <div class="tool-name">${tool.name}</div>
+                    <div class="tool-description">${tool.description || 'No description available'}</div>
+                    ${tool['x-mcp-tool']?.capabilities ? `
                         <div class="capabilities">
-                            ${{tool['x-mcp-tool'].capabilities.map(cap => `<span class="capability">${{cap}}</span>`).join('')}}
+                            ${tool['x-mcp-tool'].capabilities.map(cap => `<span class="capability">${cap}</span>`).join('')}
                         </div>
-                    ` : ''}}
-                    ${{tool['x-mcp-tool']?.examples?.[0] ? `
+                    ` : ''}
+                    ${tool['x-mcp-tool']?.examples?.[0] ? `
                         <div class="example">
                             <strong>Example usage:</strong><br>
-                            ${{JSON.stringify(tool['x-mcp-tool'].examples[0], null, 2)}}
+                            ${JSON.stringify(tool['x-mcp-tool'].examples[0], null, 2)}
                         </div>
-                    ` : ''}}
+                    ` : ''}
                 </div>
             `).join('');
-        }}
+        }
 
         loadCatalog();
     </script>
 </body>
-</html>"""
\ No newline at end of file
+</html>"""
+_BROWSER_PREFIX, _BROWSER_SUFFIX = _BROWSER_TEMPLATE.encode().split(b'{BASE_URL}', 1)
+
+
+def generate_catalog_browser(request: web_request.Request) -> bytes:
+    """Render the default catalog browser HTML for this request's host."""
+    base_url = f"{request.scheme}://{request.host}"
+    return _BROWSER_PREFIX + base_url.encode() + _BROWSER_SUFFIX
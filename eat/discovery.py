@@ -3,39 +3,68 @@ Tool discovery and catalog management for the EAT Framework.
 """
 
 import asyncio
-import hashlib
-import json
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Union
 import aiohttp
 import logging
 from urllib.parse import urljoin, urlparse
 
-from .security import CatalogVerifier
-from .mcp_client import MCPClient
+from . import _json
+from .security import CatalogVerifier, verify_content_integrity
+from .mcp_client import MCPClient, _make_connector
+
+try:
+    import msgpack
+except ImportError:  # optional accelerator; JSON remains the wire default
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+# Alternate binary catalog representation, negotiated via Accept when the
+# optional msgpack dependency is installed on both ends.
+MSGPACK_CONTENT_TYPE = 'application/vnd.eat.catalog+msgpack'
+
+
+# Shared fallback for specs without an x-mcp-tool block, so misses do not
+# allocate a fresh empty dict per Tool.
+_EMPTY: Dict[str, Any] = {}
+
 
 class Tool:
     """Represents a discoverable tool from an EAT catalog."""
     
+    __slots__ = ('catalog', 'spec', 'id', 'description', 'parameters',
+                 'examples', 'server_url', 'capabilities', '_client')
+    
     def __init__(self, spec: Dict[str, Any], catalog: 'Catalog'):
         self.catalog = catalog
         self.spec = spec
         self.id = spec.get('name', spec.get('operationId', ''))
         self.description = spec.get('description', '')
         self.parameters = spec.get('parameters', {})
-        self.examples = spec.get('x-mcp-tool', {}).get('examples', [])
-        self.server_url = spec.get('x-mcp-tool', {}).get('server_url', '')
-        self.capabilities = spec.get('x-mcp-tool', {}).get('capabilities', [])
+        mcp = spec.get('x-mcp-tool') or _EMPTY
+        self.examples = mcp.get('examples', [])
+        self.server_url = mcp.get('server_url', '')
+        self.capabilities = mcp.get('capabilities', [])
+        self._client: Optional[MCPClient] = None
         
     async def call(self, **params) -> Dict[str, Any]:
         """Call this tool via MCP protocol."""
         if not self.server_url:
             raise ValueError(f"No server URL configured for tool {self.id}")
             
-        client = MCPClient(self.server_url)
-        return await client.call_tool(self, params)
+        # Reuse one client (and its pooled connections) across calls;
+        # tools are cached on the catalog, so repeated calls skip the
+        # per-call TCP/TLS setup a fresh client would pay.
+        if self._client is None:
+            self._client = MCPClient(self.server_url)
+        return await self._client.call_tool(self, params)
+    
+    async def aclose(self):
+        """Close the pooled MCP client, if one was created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
     
     def __repr__(self):
         return f"Tool(id='{self.id}', description='{self.description[:50]}...')"
@@ -49,26 +78,72 @@ class Catalog:
         self.verify_signatures = verify_signatures
         self._catalog_data: Optional[Dict[str, Any]] = None
         self._tools: Optional[List[Tool]] = None
+        self._by_id: Optional[Dict[str, Tool]] = None
+        self._cap_index: Optional[Dict[str, set]] = None
         self._verifier = CatalogVerifier() if verify_signatures else None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=_make_connector())
+        return self._session
+    
+    async def aclose(self):
+        """Close pooled HTTP resources held by this catalog."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._verifier is not None:
+            await self._verifier.aclose()
+        for tool in self._tools or []:
+            await tool.aclose()
         
     async def fetch(self) -> Dict[str, Any]:
-        """Fetch and cache catalog from the configured URL."""
+        """Fetch and cache catalog from the configured URL.
+
+        Sends conditional-request headers when a prior fetch supplied an
+        ETag or Last-Modified; a 304 reply skips the body download and
+        re-parse (and re-verification) of an unchanged catalog.
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.url) as response:
-                    response.raise_for_status()
-                    content = await response.text()
+            headers = {}
+            if self._catalog_data is not None:
+                if self._etag:
+                    headers['If-None-Match'] = self._etag
+                if self._last_modified:
+                    headers['If-Modified-Since'] = self._last_modified
+            if msgpack is not None:
+                headers['Accept'] = f'{MSGPACK_CONTENT_TYPE}, application/json;q=0.8'
+
+            session = await self._get_session()
+            async with session.get(self.url, headers=headers) as response:
+                if response.status == 304 and self._catalog_data is not None:
+                    logger.info(f"Catalog unchanged (304) at {self.url}")
+                    return self._catalog_data
+                response.raise_for_status()
+                self._etag = response.headers.get('ETag')
+                self._last_modified = response.headers.get('Last-Modified')
+                if msgpack is not None and response.content_type == MSGPACK_CONTENT_TYPE:
+                    # Binary alternate representation: smaller on the wire
+                    # and faster to decode than text JSON.
+                    self._set_catalog_data(msgpack.unpackb(await response.read(), raw=False))
+                    logger.info(f"Fetched catalog with {len(self._catalog_data.get('tools', []))} tools")
+                    return self._catalog_data
+                content = await response.text()
                     
             # Parse catalog data
             if self.url.endswith('.json'):
-                self._catalog_data = json.loads(content)
+                self._set_catalog_data(_json.loads(content))
             else:
                 # Assume JWS format for non-JSON URLs
                 if self._verifier:
-                    self._catalog_data = await self._verifier.verify_catalog(content, self.url)
+                    self._set_catalog_data(await self._verifier.verify_catalog(content, self.url))
                 else:
                     # Try to parse as raw JSON if verification disabled
-                    self._catalog_data = json.loads(content)
+                    self._set_catalog_data(_json.loads(content))
                     
             logger.info(f"Fetched catalog with {len(self._catalog_data.get('tools', []))} tools")
             return self._catalog_data
@@ -77,6 +152,28 @@ class Catalog:
             logger.error(f"Failed to fetch catalog from {self.url}: {e}")
             raise
     
+    def _set_catalog_data(self, data: Dict[str, Any]):
+        """Install freshly fetched catalog data, dropping stale indexes."""
+        self._catalog_data = data
+        self._tools = None
+        self._by_id = None
+        self._cap_index = None
+    
+    def _materialize_tools(self) -> List[Tool]:
+        """Build the Tool list and its id/capability indexes once."""
+        if self._tools is None:
+            self._tools = [Tool(spec, self) for spec in self._catalog_data.get('tools', [])]
+            self._index_tools()
+        return self._tools
+    
+    def _index_tools(self):
+        """Index the materialized tools so lookups stop scanning the list."""
+        self._by_id = {tool.id: tool for tool in self._tools}
+        self._cap_index = defaultdict(set)
+        for position, tool in enumerate(self._tools):
+            for capability in tool.capabilities:
+                self._cap_index[capability].add(position)
+    
     async def verify(self) -> bool:
         """Verify catalog signature and content integrity."""
         if not self.verify_signatures or not self._verifier:
@@ -87,15 +184,28 @@ class Catalog:
             await self.fetch()
             
         try:
-            # Verify content hashes for referenced specs
-            for tool_spec in self._catalog_data.get('tools', []):
-                spec_url = tool_spec.get('spec_url')
-                expected_hash = tool_spec.get('spec_hash')
-                
-                if spec_url and expected_hash:
-                    if not await self._verify_content_integrity(spec_url, expected_hash):
-                        logger.error(f"Content integrity check failed for {spec_url}")
-                        return False
+            # Check all referenced specs in parallel over the shared
+            # session, capped so a huge catalog cannot flood the server.
+            specs = [(tool_spec.get('spec_url'), tool_spec.get('spec_hash'))
+                     for tool_spec in self._catalog_data.get('tools', [])]
+            specs = [(url, expected) for url, expected in specs if url and expected]
+            if not specs:
+                logger.info("Catalog verification successful")
+                return True
+            
+            session = await self._get_session()
+            semaphore = asyncio.Semaphore(16)
+            
+            async def check(url: str, expected_hash: str) -> bool:
+                async with semaphore:
+                    ok = await verify_content_integrity(url, expected_hash, session=session)
+                if not ok:
+                    logger.error(f"Content integrity check failed for {url}")
+                return ok
+            
+            results = await asyncio.gather(*(check(url, expected) for url, expected in specs))
+            if not all(results):
+                return False
                         
             logger.info("Catalog verification successful")
             return True
@@ -104,35 +214,50 @@ class Catalog:
             logger.error(f"Catalog verification failed: {e}")
             return False
     
-    async def _verify_content_integrity(self, url: str, expected_hash: str) -> bool:
-        """Verify downloaded content matches expected SHA-256 hash."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    content = await response.read()
-                    
-            actual_hash = hashlib.sha256(content).hexdigest()
-            return actual_hash == expected_hash
-            
-        except Exception as e:
-            logger.error(f"Failed to verify content integrity for {url}: {e}")
-            return False
-    
+    async def iter_tools(self):
+        """Iterate tools lazily, fetching the catalog first if needed.
+
+        Tool wrappers are built one at a time as the caller consumes
+        them, so a caller that stops early (e.g. looking for the first
+        match) never pays for wrapping the rest of a large catalog.
+        The wrappers are cached, so a later find() reuses them.
+        """
+        if not self._catalog_data:
+            await self.fetch()
+
+        if self._tools is not None:
+            for tool in self._tools:
+                yield tool
+            return
+
+        tools = []
+        for spec in self._catalog_data.get('tools', []):
+            tool = Tool(spec, self)
+            tools.append(tool)
+            yield tool
+        self._tools = tools
+        self._index_tools()
+
     def find(self, capability: Optional[str] = None, **filters) -> List[Tool]:
         """Find tools by capability and other criteria."""
         if not self._catalog_data:
             raise RuntimeError("Catalog not fetched. Call fetch() first.")
             
-        if not self._tools:
-            self._tools = [Tool(spec, self) for spec in self._catalog_data.get('tools', [])]
-            
-        results = self._tools
+        self._materialize_tools()
         
-        # Filter by capability
+        # Capability lookups come straight off the index; a list or set
+        # of capabilities intersects the buckets (AND semantics), and
+        # further filters then only walk that shorter list.
         if capability:
-            results = [tool for tool in results if capability in tool.capabilities]
-            
+            if isinstance(capability, str):
+                positions = self._cap_index.get(capability, set())
+            else:
+                buckets = [self._cap_index.get(cap, set()) for cap in capability]
+                positions = set.intersection(*buckets) if buckets else set()
+            results = [self._tools[position] for position in sorted(positions)]
+        else:
+            results = self._tools
+        
         # Apply additional filters
         for key, value in filters.items():
             if key == 'description_contains':
@@ -142,13 +267,26 @@ class Catalog:
                 
         return results
     
+    async def call_many(self, calls) -> List[Any]:
+        """Run several tool calls concurrently.
+        
+        ``calls`` is an iterable of (tool, params) pairs. Results come
+        back in submission order, with each failure returned in place as
+        the raised exception rather than cancelling the rest of the
+        batch; the tools' pooled clients reuse keep-alive connections,
+        so N calls overlap into roughly one round-trip.
+        """
+        return await asyncio.gather(
+            *(tool.call(**params) for tool, params in calls),
+            return_exceptions=True
+        )
+    
     def get_tool(self, tool_id: str) -> Optional[Tool]:
         """Get specific tool by ID."""
-        tools = self.find()
-        for tool in tools:
-            if tool.id == tool_id:
-                return tool
-        return None
+        if not self._catalog_data:
+            raise RuntimeError("Catalog not fetched. Call fetch() first.")
+        self._materialize_tools()
+        return self._by_id.get(tool_id)
     
     @property
     def tools(self) -> List[Tool]:
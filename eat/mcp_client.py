@@ -5,12 +5,32 @@ MCP (Model Context Protocol) client implementation for tool execution.
 import asyncio
 import json
 import logging
+import os
 from typing import Any, Dict, List, Optional
 import aiohttp
 from urllib.parse import urljoin
 
+from . import _json
+
 logger = logging.getLogger(__name__)
 
+# Per-host connection cap for pooled sessions; raise via environment for
+# workloads that fan out harder against a single server.
+_LIMIT_PER_HOST = int(os.getenv('EAT_LIMIT_PER_HOST', '32'))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _make_connector() -> aiohttp.TCPConnector:
+    """Connector tuned for many concurrent MCP calls: keep-alive reuse,
+    cached DNS, and a per-host cap instead of a global one."""
+    return aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=_LIMIT_PER_HOST,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+
 
 class MCPClient:
     """Client for communicating with MCP servers."""
@@ -18,118 +38,111 @@ class MCPClient:
     def __init__(self, endpoint: str, timeout: int = 30):
         self.endpoint = endpoint.rstrip('/')
         self.timeout = timeout
+        self._url = urljoin(self.endpoint, "/mcp")
         self._session: Optional[aiohttp.ClientSession] = None
+        self._next_id = 0
         
     async def __aenter__(self):
-        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        self._session = self._make_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._session:
             await self._session.close()
             
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Build a session with orjson-backed request serialization."""
+        return aiohttp.ClientSession(
+            connector=_make_connector(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            json_serialize=_json.dumps_str
+        )
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if not self._session:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._session = self._make_session()
         return self._session
     
-    async def call_tool(self, tool: 'Tool', params: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute tool call via MCP protocol."""
-        session = await self._get_session()
+    def _build_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one JSON-RPC request envelope (no I/O).
         
-        # Prepare MCP request
-        request_data = {
+        Request ids are a plain per-client counter — JSON-RPC allows
+        integer ids, and an increment is cheaper than formatting a
+        string (and unique where id(params) on reused dicts is not).
+        """
+        self._next_id += 1
+        return {
             "jsonrpc": "2.0",
-            "id": f"tool_{tool.id}_{id(params)}",
-            "method": "tools/call",
-            "params": {
-                "name": tool.id,
-                "arguments": params
-            }
+            "id": self._next_id,
+            "method": method,
+            "params": params
         }
+    
+    @staticmethod
+    def _parse_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a JSON-RPC response payload to its result (no I/O).
         
-        try:
-            url = urljoin(self.endpoint, "/mcp")
-            async with session.post(url, json=request_data) as response:
-                response.raise_for_status()
-                result = await response.json()
-                
-            # Handle MCP response format
-            if "error" in result:
-                error = result["error"]
-                raise MCPError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
-                
-            return result.get("result", {})
-            
-        except aiohttp.ClientError as e:
-            logger.error(f"HTTP error calling tool {tool.id}: {e}")
-            raise MCPError(f"Network error: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error calling tool {tool.id}: {e}")
-            raise MCPError(f"Unexpected error: {e}")
+        Raises MCPError for an error member; protocol interpretation
+        lives here so it can be unit-tested without an event loop.
+        """
+        if "error" in payload:
+            error = payload["error"]
+            raise MCPError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
+        return payload.get("result", {})
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """List available tools from MCP server."""
-        session = await self._get_session()
+    async def _rpc(self, method: str, params: Dict[str, Any],
+                   context: str) -> Dict[str, Any]:
+        """POST one JSON-RPC request and return its result payload.
         
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": "list_tools",
-            "method": "tools/list",
-            "params": {}
-        }
+        All three public methods share this path, so the HTTP call,
+        status check, and error mapping live in exactly one place.
+        The protocol framing itself is delegated to the sans-io
+        _build_request/_parse_response pair.
+        """
+        session = await self._get_session()
+        request_data = self._build_request(method, params)
         
         try:
-            url = urljoin(self.endpoint, "/mcp")
-            async with session.post(url, json=request_data) as response:
+            # Serialize once up front: posting ready bytes skips aiohttp's
+            # per-request json hook and pins the content type explicitly.
+            payload = _json.dumps(request_data)
+            async with session.post(url=self._url, data=payload,
+                                    headers=_JSON_HEADERS) as response:
                 response.raise_for_status()
                 result = await response.json()
                 
-            if "error" in result:
-                error = result["error"]
-                raise MCPError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
-                
-            return result.get("result", {}).get("tools", [])
+            return self._parse_response(result)
             
+        except MCPError:
+            raise
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP error listing tools: {e}")
+            logger.error(f"HTTP error {context}: {e}")
             raise MCPError(f"Network error: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error listing tools: {e}")
+            logger.error(f"Unexpected error {context}: {e}")
             raise MCPError(f"Unexpected error: {e}")
     
+    async def call_tool(self, tool: 'Tool', params: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute tool call via MCP protocol."""
+        return await self._rpc(
+            "tools/call",
+            {"name": tool.id, "arguments": params},
+            f"calling tool {tool.id}"
+        )
+    
+    async def list_tools(self) -> List[Dict[str, Any]]:
+        """List available tools from MCP server."""
+        result = await self._rpc("tools/list", {}, "listing tools")
+        return result.get("tools", [])
+    
     async def get_tool_schema(self, tool_name: str) -> Dict[str, Any]:
         """Get schema for a specific tool."""
-        session = await self._get_session()
-        
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": f"schema_{tool_name}",
-            "method": "tools/get",
-            "params": {
-                "name": tool_name
-            }
-        }
-        
-        try:
-            url = urljoin(self.endpoint, "/mcp")
-            async with session.post(url, json=request_data) as response:
-                response.raise_for_status()
-                result = await response.json()
-                
-            if "error" in result:
-                error = result["error"]
-                raise MCPError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
-                
-            return result.get("result", {})
-            
-        except aiohttp.ClientError as e:
-            logger.error(f"HTTP error getting tool schema for {tool_name}: {e}")
-            raise MCPError(f"Network error: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error getting tool schema for {tool_name}: {e}")
-            raise MCPError(f"Unexpected error: {e}")
+        return await self._rpc(
+            "tools/get",
+            {"name": tool_name},
+            f"getting tool schema for {tool_name}"
+        )
     
     async def close(self):
         """Close the HTTP session."""
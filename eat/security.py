@@ -2,10 +2,14 @@
 Security implementation for EAT Framework including JWS signing and verification.
 """
 
-import json
+import asyncio
 import hashlib
 import logging
-from typing import Any, Dict, Optional
+import re
+import time
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import urlparse
 import aiohttp
 import jwt
@@ -15,26 +19,61 @@ from cryptography.hazmat.backends import default_backend
 
 logger = logging.getLogger(__name__)
 
+# How long resolved public keys stay cached when the DID/JWKS response
+# carries no Cache-Control: max-age of its own.
+_DEFAULT_KEY_TTL = 3600.0
+
+
+def _cache_ttl(response) -> float:
+    """TTL for a resolved key, from the response's Cache-Control max-age."""
+    headers = getattr(response, 'headers', None)
+    if isinstance(headers, Mapping):
+        cache_control = headers.get('Cache-Control')
+        if isinstance(cache_control, str):
+            match = re.search(r'max-age=(\d+)', cache_control)
+            if match:
+                return float(match.group(1))
+    return _DEFAULT_KEY_TTL
+
+
+@lru_cache(maxsize=32)
+def _load_private_key(pem: bytes):
+    """Deserialize a PEM private key, memoized on the raw bytes.
+    
+    RSA key parsing is the dominant cost of constructing a signer;
+    repeat signers built from the same key material reuse the parsed
+    object instead of re-deriving it.
+    """
+    return serialization.load_pem_private_key(
+        pem,
+        password=None,
+        backend=default_backend()
+    )
+
 
 class CatalogSigner:
     """Signs EAT catalogs using JWS (JSON Web Signature)."""
     
-    def __init__(self, private_key_path: str, key_id: Optional[str] = None):
-        self.private_key = self._load_private_key(private_key_path)
+    def __init__(self, private_key: Union[str, bytes], key_id: Optional[str] = None):
+        self.private_key = self._load_private_key(private_key)
         self.key_id = key_id
         
-    def _load_private_key(self, private_key_path: str):
-        """Load private key from PEM file."""
+    def _load_private_key(self, key_source: Union[str, bytes]):
+        """Load a private key from PEM bytes or a PEM file path.
+        
+        Accepting bytes lets callers that already hold the key material
+        (or generate it in memory) skip the filesystem round-trip.
+        """
+        source = '<pem bytes>' if isinstance(key_source, bytes) else key_source
         try:
-            with open(private_key_path, 'rb') as f:
-                private_key = serialization.load_pem_private_key(
-                    f.read(),
-                    password=None,
-                    backend=default_backend()
-                )
-            return private_key
+            if isinstance(key_source, bytes):
+                data = key_source
+            else:
+                with open(key_source, 'rb') as f:
+                    data = f.read()
+            return _load_private_key(data)
         except Exception as e:
-            logger.error(f"Failed to load private key from {private_key_path}: {e}")
+            logger.error(f"Failed to load private key from {source}: {e}")
             raise
     
     def sign_catalog(self, catalog: Dict[str, Any]) -> str:
@@ -67,23 +106,33 @@ class CatalogSigner:
             raise
     
     def _add_content_hashes(self, catalog: Dict[str, Any]) -> Dict[str, Any]:
-        """Add SHA-256 hashes for all referenced content."""
+        """Add SHA-256 hashes for all referenced content.
+        
+        Catalogs routinely point several tools at the same spec
+        document, so hashes are deduplicated per URL within the pass —
+        each distinct spec_url is hashed exactly once.
+        """
         catalog_copy = catalog.copy()
+        hashes_by_url: Dict[str, str] = {}
         
         # Add hashes for tool specifications
         for tool in catalog_copy.get('tools', []):
             spec_url = tool.get('spec_url')
             if spec_url and 'spec_hash' not in tool:
-                # Note: In production, you'd fetch and hash the actual content
-                # For now, we'll generate a placeholder hash
-                tool['spec_hash'] = self._compute_placeholder_hash(spec_url)
+                spec_hash = hashes_by_url.get(spec_url)
+                if spec_hash is None:
+                    # Note: In production, you'd fetch and hash the actual content
+                    # For now, we'll generate a placeholder hash
+                    spec_hash = self._compute_placeholder_hash(spec_url)
+                    hashes_by_url[spec_url] = spec_hash
+                tool['spec_hash'] = spec_hash
                 
         return catalog_copy
     
     def _compute_placeholder_hash(self, url: str) -> str:
         """Compute placeholder hash for development purposes."""
         # In production, this should fetch the actual content and hash it
-        return hashlib.sha256(url.encode()).hexdigest()
+        return hashlib.sha256(url.encode()).digest().hex()
 
 
 class CatalogVerifier:
@@ -91,6 +140,23 @@ class CatalogVerifier:
     
     def __init__(self, trusted_keys: Optional[Dict[str, str]] = None):
         self.trusted_keys = trusted_keys or {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Materialized public keys cached per (domain, kid) as
+        # (monotonic expiry, key); locks coalesce concurrent refetches.
+        self._key_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Any]] = {}
+        self._key_locks: Dict[Tuple[str, Optional[str]], asyncio.Lock] = {}
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session for key fetches."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
     async def verify_catalog(self, signed_catalog: str, catalog_url: str) -> Dict[str, Any]:
         """Verify JWS signature and return catalog content."""
@@ -121,32 +187,107 @@ class CatalogVerifier:
             logger.error(f"Unexpected error during verification: {e}")
             raise SecurityError(f"Catalog verification failed: {e}")
     
+    def _cached_key(self, cache_key: Tuple[str, Optional[str]]):
+        """Return the cached key for (domain, kid) if still fresh."""
+        cached = self._key_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+    
+    def _store_key(self, cache_key: Tuple[str, Optional[str]], key, ttl: float):
+        """Cache a materialized key under (domain, kid) for ttl seconds."""
+        self._key_cache[cache_key] = (time.monotonic() + ttl, key)
+    
     async def _get_public_key(self, catalog_url: str, key_id: Optional[str] = None):
-        """Get public key for signature verification using DID:web resolution."""
-        try:
-            # Extract domain from catalog URL for DID:web resolution
-            parsed_url = urlparse(catalog_url)
-            domain = parsed_url.netloc
-            
-            # Construct DID:web URL for key resolution
-            did_web_url = f"https://{domain}/.well-known/did.json"
+        """Get public key for signature verification using DID:web resolution.
+        
+        Resolved keys are cached per (domain, kid) with a TTL taken from
+        the response's Cache-Control max-age, so steady-state
+        verification skips both the HTTP round-trip and rebuilding the
+        RSA key from the JWK. Concurrent misses for the same key
+        coalesce on a lock so only one fetch goes out.
+        """
+        # Extract domain from catalog URL for DID:web resolution
+        domain = urlparse(catalog_url).netloc
+        cache_key = (domain, key_id)
+        
+        cached = self._cached_key(cache_key)
+        if cached is not None:
+            return cached
+        
+        lock = self._key_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached = self._cached_key(cache_key)
+            if cached is not None:
+                return cached
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(did_web_url) as response:
-                    if response.status == 200:
-                        did_document = await response.json()
-                        return self._extract_public_key_from_did(did_document, key_id)
+            try:
+                # Race the DID:web and JWKS lookups instead of trying
+                # them back to back: the slow path costs min(DID, JWKS)
+                # rather than their sum, and the first usable key wins.
+                did_task = asyncio.create_task(
+                    self._fetch_did_key(domain, key_id, cache_key))
+                jwks_task = asyncio.create_task(
+                    self._fetch_jwks_key(catalog_url, key_id))
+                
+                tasks = {did_task, jwks_task}
+                try:
+                    while tasks:
+                        done, tasks = await asyncio.wait(
+                            tasks, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            key = task.result()
+                            if key is not None:
+                                logger.debug("Public key resolved via %s",
+                                             'DID:web' if task is did_task else 'JWKS')
+                                return key
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                
+                # Fallback: look for trusted key in configuration
+                if key_id and key_id in self.trusted_keys:
+                    key = self._load_public_key_from_string(self.trusted_keys[key_id])
+                    self._store_key(cache_key, key, _DEFAULT_KEY_TTL)
+                    return key
                     
-            # Fallback: look for trusted key in configuration
-            if key_id and key_id in self.trusted_keys:
-                return self._load_public_key_from_string(self.trusted_keys[key_id])
+                raise SecurityError("No public key found via DID:web or JWKS")
                 
-            # Fallback: use jwks_uri from catalog metadata
-            return await self._get_key_from_jwks(catalog_url, key_id)
+            except Exception as e:
+                logger.error(f"Failed to get public key: {e}")
+                raise SecurityError(f"Could not retrieve public key for verification: {e}")
+    
+    async def _fetch_did_key(self, domain: str, key_id: Optional[str],
+                             cache_key: Tuple[str, Optional[str]]):
+        """Resolve and cache a key from the domain's DID:web document.
+        
+        Returns None when the document is missing or holds no usable
+        key, so the caller can fall through to other sources.
+        """
+        try:
+            did_web_url = f"https://{domain}/.well-known/did.json"
+            
+            session = await self._get_session()
+            async with session.get(did_web_url) as response:
+                if response.status != 200:
+                    return None
+                did_document = await response.json()
+                ttl = _cache_ttl(response)
+            
+            key = self._extract_public_key_from_did(did_document, key_id)
+            self._store_key(cache_key, key, ttl)
+            return key
             
         except Exception as e:
-            logger.error(f"Failed to get public key: {e}")
-            raise SecurityError(f"Could not retrieve public key for verification: {e}")
+            logger.debug(f"DID:web key resolution failed for {domain}: {e}")
+            return None
+    
+    async def _fetch_jwks_key(self, catalog_url: str, key_id: Optional[str]):
+        """JWKS lookup as a race participant; failures map to None."""
+        try:
+            return await self._get_key_from_jwks(catalog_url, key_id)
+        except SecurityError:
+            return None
     
     def _extract_public_key_from_did(self, did_document: Dict[str, Any], key_id: Optional[str]):
         """Extract public key from DID document."""
@@ -156,7 +297,10 @@ class CatalogVerifier:
             if not key_id or method.get('id', '').endswith(key_id):
                 public_key_jwk = method.get('publicKeyJwk')
                 if public_key_jwk:
-                    return jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(public_key_jwk))
+                    # from_jwk accepts the dict directly (PyJWT >= 2.0);
+                    # serializing it back to JSON first just to have it
+                    # re-parsed was a wasted round-trip.
+                    return jwt.algorithms.RSAAlgorithm.from_jwk(public_key_jwk)
                     
         raise SecurityError("No suitable public key found in DID document")
     
@@ -166,15 +310,18 @@ class CatalogVerifier:
         jwks_url = f"{parsed_url.scheme}://{parsed_url.netloc}/.well-known/jwks.json"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(jwks_url) as response:
-                    response.raise_for_status()
-                    jwks = await response.json()
+            session = await self._get_session()
+            async with session.get(jwks_url) as response:
+                response.raise_for_status()
+                jwks = await response.json()
+                ttl = _cache_ttl(response)
                     
             keys = jwks.get('keys', [])
             for key in keys:
                 if not key_id or key.get('kid') == key_id:
-                    return jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(key))
+                    public_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
+                    self._store_key((parsed_url.netloc, key_id), public_key, ttl)
+                    return public_key
                     
             raise SecurityError("No suitable key found in JWKS")
             
@@ -196,19 +343,47 @@ class CatalogVerifier:
 
 def compute_sha256(content: bytes) -> str:
     """Compute SHA-256 hash for content integrity verification."""
-    return hashlib.sha256(content).hexdigest()
+    # .digest().hex() takes the C fast path for hex encoding; the sha256
+    # rounds themselves run in OpenSSL (SHA-NI where the CPU has it).
+    return hashlib.sha256(content).digest().hex()
+
+
+def compute_sha256_file(path) -> str:
+    """Compute SHA-256 of a file without buffering it whole in Python."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').digest().hex()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+        return digest.digest().hex()
+
+
+async def _stream_hash(session: aiohttp.ClientSession, url: str) -> str:
+    """Download url through session, hashing 64 KiB chunks as they arrive."""
+    digest = hashlib.sha256()
+    async with session.get(url) as response:
+        response.raise_for_status()
+        async for chunk in response.content.iter_chunked(65536):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
-async def verify_content_integrity(url: str, expected_hash: str) -> bool:
-    """Verify downloaded content matches expected SHA-256 hash."""
+async def verify_content_integrity(url: str, expected_hash: str,
+                                   session: Optional[aiohttp.ClientSession] = None) -> bool:
+    """Verify downloaded content matches expected SHA-256 hash.
+
+    The body is hashed incrementally as chunks arrive, so peak memory
+    stays at one 64 KiB chunk however large the spec is. A supplied
+    shared session is reused (and left open); without one, a throwaway
+    session is created for the single download.
+    """
     try:
+        if session is not None:
+            return await _stream_hash(session, url) == expected_hash
+        
         async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                content = await response.read()
-                
-        actual_hash = compute_sha256(content)
-        return actual_hash == expected_hash
+            return await _stream_hash(session, url) == expected_hash
         
     except Exception as e:
         logger.error(f"Failed to verify content integrity for {url}: {e}")
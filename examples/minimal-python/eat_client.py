@@ -4,40 +4,252 @@ Minimal EAT Client Implementation
 A complete EAT-compatible client in under 50 lines of Python.
 """
 
-import requests
-import json
-from typing import Dict, List, Any, Optional
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiohttp
+    from typing import Dict, List, Any, Optional
+
+# HTTP stacks are imported lazily so that cold start pays for the
+# standard library only; requests (and urllib3 et al.) load on the
+# first EATClient, aiohttp on the first AsyncEATClient.
+requests = None
+_HTTPAdapter = None
+_Retry = None
+aiohttp = None
+
+
+def _import_requests() -> None:
+    global requests, _HTTPAdapter, _Retry
+    if requests is None:
+        import requests  # noqa: F811 -- rebinds the module global
+        from requests.adapters import HTTPAdapter as _HTTPAdapter
+        from urllib3.util.retry import Retry as _Retry
+
+
+def _import_aiohttp() -> None:
+    global aiohttp
+    if aiohttp is None:
+        import aiohttp  # noqa: F811 -- rebinds the module global
+
+
+try:
+    # orjson parses ~2x and serializes ~5x faster than stdlib json;
+    # fall back transparently when it is not installed.
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+try:
+    # Optional streaming parser: keeps peak memory at one tool instead
+    # of the whole body for very large catalogs.
+    import ijson
+except ImportError:
+    ijson = None
+
+# Catalogs announcing a body larger than this stream-parse when ijson is
+# available; smaller ones are cheaper to load in one shot.
+_STREAM_THRESHOLD = 1 << 20
+
+
+# Bump when the cached tool layout changes so old files are discarded.
+_CACHE_VERSION = 1
+
+
+def _ingest_tool(tool: Dict[str, Any], tools: Dict[str, Dict[str, Any]],
+                 by_capability: Dict[str, List[str]]) -> None:
+    """Add one catalog tool entry to the tool/capability maps."""
+    mcp_config = tool.get('x-mcp-tool', {})
+    name = tool['name']
+    capabilities = frozenset(mcp_config.get('capabilities', []))
+    # Entries are read-only views over immutable members, so lookups can
+    # hand them out directly instead of copying.
+    tools[name] = MappingProxyType({
+        'description': tool.get('description', ''),
+        'server_url': mcp_config['server_url'],
+        'capabilities': capabilities,
+        'examples': tuple(mcp_config.get('examples', ()))
+    })
+    for capability in capabilities:
+        by_capability.setdefault(capability, []).append(name)
+
+
+def _ingest_catalog(catalog: Dict[str, Any], tools: Dict[str, Dict[str, Any]],
+                    by_capability: Dict[str, List[str]]) -> None:
+    """Validate a catalog dict and populate the tool/capability maps."""
+    if catalog.get('version') != '1.0':
+        raise ValueError(f"Unsupported catalog version: {catalog.get('version')}")
+    
+    for tool in catalog.get('tools', []):
+        _ingest_tool(tool, tools, by_capability)
 
 
 class EATClient:
     """Minimal EAT client for tool discovery and execution."""
     
-    def __init__(self, catalog_url: str):
-        """Initialize client with catalog URL."""
+    def __init__(self, catalog_url: str, cache_path: Optional[str] = None,
+                 cache_ttl: int = 300):
+        """Initialize client with catalog URL.
+        
+        With cache_path set, the parsed catalog is persisted to disk:
+        within cache_ttl seconds discovery makes no request at all, and
+        after that a conditional GET lets an unchanged catalog come back
+        as a body-less 304.
+        """
         self.catalog_url = catalog_url
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
         self.tools: Dict[str, Dict[str, Any]] = {}
+        self._by_capability: Dict[str, List[str]] = {}
+        # One pooled session for every request this client makes:
+        # keep-alive reuse instead of a fresh TCP+TLS handshake per call,
+        # with retries for transient gateway errors.
+        _import_requests()
+        self._session = requests.Session()
+        adapter = _HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=_Retry(total=3, backoff_factor=0.2,
+                               status_forcelist=[502, 503, 504]),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._req_counter = itertools.count()
+        # Static portion of the JSON-RPC envelope, serialized once; each
+        # call only encodes the id, tool name, and arguments leaves.
+        self._envelope_prefix = b'{"jsonrpc":"2.0","method":"tools/call","id":'
         self._discover()
     
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+    
+    def __enter__(self) -> "EATClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def _load_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the cache file, discarding unreadable or outdated layouts."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if cached.get('cache_version') != _CACHE_VERSION:
+            return None
+        return cached
+    
+    def _write_cache(self, payload: Dict[str, Any]) -> None:
+        """Atomically persist the parsed catalog next to its validators."""
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(payload))
+        os.replace(tmp_path, self.cache_path)
+    
+    def _install_cached(self, cached: Dict[str, Any]) -> None:
+        """Rebuild tools and the capability index from cached data."""
+        for name, info in cached['tools'].items():
+            info = dict(info)
+            info['capabilities'] = frozenset(info['capabilities'])
+            info['examples'] = tuple(info['examples'])
+            self.tools[name] = MappingProxyType(info)
+            for capability in info['capabilities']:
+                self._by_capability.setdefault(capability, []).append(name)
+    
+    def _ingest_catalog_stream(self, raw) -> None:
+        """Incrementally parse a catalog body, one tool at a time."""
+        version = None
+        builder = None
+        for prefix, event, value in ijson.parse(raw):
+            if prefix == 'version':
+                version = value
+            elif prefix == 'tools.item' and event == 'start_map':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif builder is not None:
+                builder.event(event, value)
+                if prefix == 'tools.item' and event == 'end_map':
+                    _ingest_tool(builder.value, self.tools, self._by_capability)
+                    builder = None
+        
+        if version != '1.0':
+            raise ValueError(f"Unsupported catalog version: {version}")
+    
     def _discover(self) -> None:
-        """Fetch and parse the tool catalog."""
+        """Fetch and parse the tool catalog, reusing the disk cache."""
+        cached = self._load_cache()
+        if cached and time.time() - cached['fetched_at'] < self.cache_ttl:
+            self._install_cached(cached)
+            return
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
         try:
-            response = requests.get(self.catalog_url, timeout=10)
+            response = self._session.get(self.catalog_url, timeout=10,
+                                         headers=headers,
+                                         stream=ijson is not None)
+            if response.status_code == 304 and cached:
+                # Catalog unchanged upstream: skip the body download and
+                # re-parse entirely, just refresh the TTL clock.
+                self._install_cached(cached)
+                cached['fetched_at'] = time.time()
+                self._write_cache(cached)
+                return
             response.raise_for_status()
-            catalog = response.json()
-            
-            # Validate catalog format
-            if catalog.get('version') != '1.0':
-                raise ValueError(f"Unsupported catalog version: {catalog.get('version')}")
+            content_length = int(response.headers.get('Content-Length') or 0)
+            if ijson is not None and content_length > _STREAM_THRESHOLD:
+                # Stream large bodies: parser and tool map share one pass
+                # over the bytes, so tools become available while the
+                # download is still in flight.
+                response.raw.decode_content = True
+                self._ingest_catalog_stream(response.raw)
+            else:
+                catalog = _loads(response.content)
+                _ingest_catalog(catalog, self.tools, self._by_capability)
             
-            # Extract tool information
-            for tool in catalog.get('tools', []):
-                mcp_config = tool.get('x-mcp-tool', {})
-                self.tools[tool['name']] = {
-                    'description': tool.get('description', ''),
-                    'server_url': mcp_config['server_url'],
-                    'capabilities': mcp_config.get('capabilities', []),
-                    'examples': mcp_config.get('examples', [])
-                }
+            if self.cache_path:
+                self._write_cache({
+                    'cache_version': _CACHE_VERSION,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'fetched_at': time.time(),
+                    'tools': {name: {**info, 'capabilities': sorted(info['capabilities'])}
+                              for name, info in self.tools.items()},
+                })
                 
         except requests.RequestException as e:
             raise ConnectionError(f"Failed to fetch catalog: {e}")
@@ -50,16 +262,21 @@ class EATClient:
     
     def find_tools(self, capability: str) -> List[str]:
         """Find tools by capability."""
-        return [
-            name for name, info in self.tools.items()
-            if capability in info['capabilities']
-        ]
+        return list(self._by_capability.get(capability, ()))
     
     def get_tool_info(self, tool_name: str) -> Dict[str, Any]:
-        """Get detailed information about a tool."""
+        """Get detailed information about a tool.
+        
+        Returns a read-only view; no copy is made. Use
+        get_tool_info_copy() if you need a mutable dict.
+        """
         if tool_name not in self.tools:
             raise ValueError(f"Unknown tool: {tool_name}")
-        return self.tools[tool_name].copy()
+        return self.tools[tool_name]
+    
+    def get_tool_info_copy(self, tool_name: str) -> Dict[str, Any]:
+        """Get a mutable copy of a tool's information."""
+        return dict(self.get_tool_info(tool_name))
     
     def call_tool(self, tool_name: str, **arguments) -> Any:
         """Execute a tool via MCP protocol."""
@@ -69,26 +286,25 @@ class EATClient:
         server_url = self.tools[tool_name]['server_url']
         
         # Prepare MCP request
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": f"call-{hash(str(arguments))}",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
+        # Assemble the body around the prebuilt envelope: three small
+        # serializations of flat leaves instead of one over a nested
+        # dict, and no per-call envelope dict at all. The id is a plain
+        # counter — unique per client, cheaper than formatting a string.
+        body = (self._envelope_prefix + b'%d' % next(self._req_counter)
+                + b',"params":{"name":' + _dumps(tool_name)
+                + b',"arguments":' + _dumps(arguments) + b'}}')
         
         try:
             # Make MCP call
-            response = requests.post(
+            # Pre-serialized body skips requests' stdlib json.dumps
+            response = self._session.post(
                 server_url,
-                json=request_data,
+                data=body,
                 headers={"Content-Type": "application/json"},
                 timeout=30
             )
             response.raise_for_status()
-            result = response.json()
+            result = _loads(response.content)
             
             # Handle MCP errors
             if 'error' in result:
@@ -103,6 +319,117 @@ class EATClient:
             raise ValueError(f"Invalid MCP response: {e}")
 
 
+class AsyncEATClient:
+    """Async EAT client: same protocol as EATClient, concurrent calls.
+    
+    Usage::
+    
+        async with AsyncEATClient(url) as client:
+            await client.discover()
+            results = await client.call_many([("say_hello", {"name": "EAT"})])
+    """
+    
+    def __init__(self, catalog_url: str, max_concurrency: int = 10):
+        _import_aiohttp()
+        self.catalog_url = catalog_url
+        self.max_concurrency = max_concurrency
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        self._by_capability: Dict[str, List[str]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._req_counter = itertools.count()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300,
+                                               keepalive_timeout=30),
+                json_serialize=lambda obj: _dumps(obj).decode()
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "AsyncEATClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+    
+    async def discover(self) -> "AsyncEATClient":
+        """Fetch and parse the tool catalog."""
+        try:
+            session = await self._get_session()
+            async with session.get(self.catalog_url,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                catalog = _loads(await response.read())
+            _ingest_catalog(catalog, self.tools, self._by_capability)
+        except aiohttp.ClientError as e:
+            raise ConnectionError(f"Failed to fetch catalog: {e}")
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid catalog format: {e}")
+        return self
+    
+    def find_tools(self, capability: str) -> List[str]:
+        """Find tools by capability."""
+        return list(self._by_capability.get(capability, ()))
+    
+    async def call_tool(self, tool_name: str, **arguments) -> Any:
+        """Execute a tool via MCP protocol."""
+        if tool_name not in self.tools:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        
+        server_url = self.tools[tool_name]['server_url']
+        request_data = {
+            "jsonrpc": "2.0",
+            "id": f"call-{next(self._req_counter)}",
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        }
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        try:
+            session = await self._get_session()
+            async with self._semaphore:
+                async with session.post(server_url, json=request_data,
+                                        timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    result = _loads(await response.read())
+            
+            if 'error' in result:
+                error = result['error']
+                raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
+            
+            return result['result']['output']
+            
+        except aiohttp.ClientError as e:
+            raise ConnectionError(f"MCP call failed: {e}")
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid MCP response: {e}")
+    
+    async def call_many(self, calls: List[tuple]) -> List[Any]:
+        """Run (tool_name, arguments) calls concurrently.
+        
+        Results come back in submission order; failures are returned in
+        place instead of cancelling the batch. Concurrency is bounded by
+        max_concurrency so a large batch cannot overload the server.
+        """
+        return await asyncio.gather(
+            *(self.call_tool(name, **args) for name, args in calls),
+            return_exceptions=True
+        )
+
+
 def main():
     """Example usage of the EAT client."""
     # Initialize client (change URL for your catalog)
@@ -151,7 +478,7 @@ def main():
                 else:
                     result = client.call_tool(tool_name)
             
-            print(f"✅ Result: {json.dumps(result, indent=2)}")
+            print(f"✅ Result: {_pretty(result)}")
             
         except Exception as e:
             print(f"❌ Error calling tool: {e}")
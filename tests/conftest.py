@@ -3,21 +3,150 @@ Pytest configuration and shared fixtures for EAT Framework tests.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import tempfile
 import os
 import json
+from collections import deque
 from pathlib import Path
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from eat import _json
+
+
+try:
+    # Async tests run noticeably faster on uvloop, especially the ones
+    # doing real aiohttp traffic; fall back to the stock loop without it.
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Loop policy for async tests: uvloop when installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an event loop for the test session."""
-    loop = asyncio.new_event_loop()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
     yield loop
     loop.close()
 
 
+class FakeMCPResponse:
+    """Minimal stand-in for an aiohttp response carrying one payload."""
+    
+    def __init__(self, payload):
+        self._payload = payload
+        self.status = 200
+    
+    def raise_for_status(self):
+        pass
+    
+    async def json(self):
+        return self._payload
+
+
+class _FakeRequestContext:
+    """Async context manager wrapping a fake response."""
+    
+    def __init__(self, response):
+        self._response = response
+    
+    async def __aenter__(self):
+        return self._response
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class FakeMCPTransport:
+    """In-memory aiohttp-session stand-in for MCP client tests.
+    
+    post() dispatches on the JSON-RPC method in the request body to a
+    canned payload registered in .responses, records the request for
+    assertions, and hands back a plain response object — no Mock
+    bookkeeping, no per-test patching of aiohttp.ClientSession.post.
+    A deque registered for a method is consumed one response per call,
+    for tests that hit the same method repeatedly. Set .error to make
+    the next post raise instead.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear canned responses and captured request state."""
+        self.responses = {}
+        self.error = None
+        self.closed = False
+        self.last_url = None
+        self.last_request_body = None
+        self.request_count = 0
+    
+    def post(self, url=None, json=None, data=None, **kwargs):
+        # The client posts pre-serialized bytes; decode them so tests keep
+        # asserting against a plain dict.
+        body = json if json is not None else _json.loads(data)
+        self.last_url = url
+        self.last_request_body = body
+        self.request_count += 1
+        if self.error is not None:
+            raise self.error
+        canned = self.responses[body["method"]]
+        if isinstance(canned, deque):
+            canned = canned.popleft()
+        return _FakeRequestContext(FakeMCPResponse(canned))
+    
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="session")
+def mcp_transport():
+    """One in-memory MCP transport shared across the whole run."""
+    return FakeMCPTransport()
+
+
+@pytest_asyncio.fixture
+async def catalog_server():
+    """Factory for in-process catalog servers.
+    
+    Starts a real aiohttp server on a loopback port and returns the
+    catalog URL, so fetch tests exercise actual async I/O instead of
+    four lines of AsyncMock scaffolding per test. Servers are torn down
+    after the test.
+    """
+    servers = []
+    
+    async def _start(catalog_data):
+        async def handler(request):
+            return web.json_response(catalog_data)
+        
+        app = web.Application()
+        app.router.add_get('/.well-known/api-catalog', handler)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return str(server.make_url('/.well-known/api-catalog'))
+    
+    yield _start
+    for server in servers:
+        await server.close()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -25,9 +154,13 @@ def temp_dir():
         yield Path(temp_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_openapi_spec():
-    """Sample OpenAPI specification with x-mcp-tool extensions."""
+    """Sample OpenAPI specification with x-mcp-tool extensions.
+    
+    Session-scoped: the dict is a pure literal no test mutates, so one
+    build serves the whole run instead of one per test.
+    """
     return {
         "openapi": "3.0.0",
         "info": {
@@ -136,9 +269,9 @@ def sample_openapi_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_catalog():
-    """Sample EAT catalog for testing."""
+    """Sample EAT catalog for testing. Session-scoped; see above."""
     return {
         "version": "1.0",
         "metadata": {
@@ -195,14 +328,22 @@ def sample_catalog():
 @pytest.fixture
 def create_test_spec_file(temp_dir, sample_openapi_spec):
     """Create a test OpenAPI specification file."""
+    created = {}
+    
     def _create_spec_file(filename="test-api.yaml", spec_data=None):
         if spec_data is None:
             spec_data = sample_openapi_spec
         
+        # Repeated calls with the same inputs reuse the written file.
+        key = (filename, id(spec_data))
+        if key in created:
+            return created[key]
+        
         spec_file = temp_dir / filename
         with open(spec_file, 'w') as f:
             json.dump(spec_data, f, indent=2)
         
+        created[key] = spec_file
         return spec_file
     
     return _create_spec_file
@@ -211,22 +352,30 @@ def create_test_spec_file(temp_dir, sample_openapi_spec):
 @pytest.fixture
 def create_test_catalog_file(temp_dir, sample_catalog):
     """Create a test catalog file."""
+    created = {}
+    
     def _create_catalog_file(filename="catalog.json", catalog_data=None):
         if catalog_data is None:
             catalog_data = sample_catalog
         
+        # Repeated calls with the same inputs reuse the written file.
+        key = (filename, id(catalog_data))
+        if key in created:
+            return created[key]
+        
         catalog_file = temp_dir / filename
         with open(catalog_file, 'w') as f:
             json.dump(catalog_data, f, indent=2)
         
+        created[key] = catalog_file
         return catalog_file
     
     return _create_catalog_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mcp_server_response():
-    """Mock MCP server response data."""
+    """Mock MCP server response data. Session-scoped; see above."""
     return {
         "jsonrpc": "2.0",
         "id": "test-request",
@@ -237,9 +386,9 @@ def mock_mcp_server_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mcp_error_response():
-    """Mock MCP server error response."""
+    """Mock MCP server error response. Session-scoped; see above."""
     return {
         "jsonrpc": "2.0",
         "id": "test-request",
@@ -262,4 +411,8 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "network: mark test as requiring network access"
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): group tests onto one pytest-xdist worker"
     )
\ No newline at end of file
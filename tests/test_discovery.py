@@ -5,7 +5,7 @@ Tests for EAT Framework discovery functionality.
 import pytest
 import json
 import asyncio
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from eat.discovery import Catalog, Tool
 from eat.security import SecurityError
@@ -53,32 +53,26 @@ class TestCatalog:
         return Catalog("http://test.example.com/.well-known/api-catalog", verify_signatures=False)
     
     @pytest.mark.asyncio
-    async def test_fetch_json_catalog(self, catalog, sample_catalog_data):
-        """Test fetching a JSON catalog."""
-        with patch('aiohttp.ClientSession.get') as mock_get:
-            # Mock the HTTP response
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_response.text = AsyncMock(return_value=json.dumps(sample_catalog_data))
-            
-            mock_get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_get.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Test fetch
+    async def test_fetch_json_catalog(self, catalog_server, sample_catalog_data):
+        """Test fetching a JSON catalog from a live in-process server."""
+        url = await catalog_server(sample_catalog_data)
+        catalog = Catalog(url, verify_signatures=False)
+        try:
             result = await catalog.fetch()
             
             assert result == sample_catalog_data
             assert catalog._catalog_data == sample_catalog_data
+        finally:
+            await catalog.aclose()
     
     @pytest.mark.asyncio
-    async def test_fetch_with_network_error(self, catalog):
+    async def test_fetch_with_network_error(self, monkeypatch, catalog):
         """Test handling of network errors during fetch."""
-        with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_get.side_effect = Exception("Network error")
-            
-            with pytest.raises(Exception, match="Network error"):
-                await catalog.fetch()
+        monkeypatch.setattr("aiohttp.ClientSession.get",
+                            MagicMock(side_effect=Exception("Network error")))
+        
+        with pytest.raises(Exception, match="Network error"):
+            await catalog.fetch()
     
     @pytest.mark.asyncio
     async def test_verify_without_signature_checking(self, catalog, sample_catalog_data):
@@ -216,21 +210,21 @@ class TestTool:
         assert tool.description == "Get user by ID"
     
     @pytest.mark.asyncio
-    async def test_tool_call_success(self, tool_spec, catalog_mock):
+    async def test_tool_call_success(self, monkeypatch, tool_spec, catalog_mock):
         """Test successful tool call."""
         tool = Tool(tool_spec, catalog_mock)
         
         # Mock MCPClient
-        with patch('eat.discovery.MCPClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.call_tool.return_value = {"result": "success"}
-            mock_client_class.return_value = mock_client
-            
-            result = await tool.call(input="test")
-            
-            assert result == {"result": "success"}
-            mock_client_class.assert_called_once_with("http://localhost:3001")
-            mock_client.call_tool.assert_called_once_with(tool, {"input": "test"})
+        mock_client = AsyncMock()
+        mock_client.call_tool.return_value = {"result": "success"}
+        mock_client_class = MagicMock(return_value=mock_client)
+        monkeypatch.setattr("eat.discovery.MCPClient", mock_client_class)
+        
+        result = await tool.call(input="test")
+        
+        assert result == {"result": "success"}
+        mock_client_class.assert_called_once_with("http://localhost:3001")
+        mock_client.call_tool.assert_called_once_with(tool, {"input": "test"})
     
     @pytest.mark.asyncio
     async def test_tool_call_without_server_url(self, catalog_mock):
@@ -254,7 +248,7 @@ class TestCatalogIntegration:
     """Integration tests for catalog functionality."""
     
     @pytest.mark.asyncio
-    async def test_full_catalog_workflow(self):
+    async def test_full_catalog_workflow(self, monkeypatch, catalog_server):
         """Test complete catalog workflow: fetch, verify, find, call."""
         catalog_data = {
             "version": "1.0",
@@ -270,18 +264,11 @@ class TestCatalogIntegration:
             ]
         }
         
-        catalog = Catalog("http://test.example.com/.well-known/api-catalog", verify_signatures=False)
+        url = await catalog_server(catalog_data)
+        catalog = Catalog(url, verify_signatures=False)
         
-        # Mock the HTTP response
-        with patch('aiohttp.ClientSession.get') as mock_get:
-            mock_response = AsyncMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_response.text = AsyncMock(return_value=json.dumps(catalog_data))
-            
-            mock_get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_get.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Fetch catalog
+        try:
+            # Fetch catalog over real HTTP
             await catalog.fetch()
             
             # Verify catalog
@@ -296,13 +283,15 @@ class TestCatalogIntegration:
             assert tool.id == "integration_tool"
             
             # Mock tool call
-            with patch('eat.discovery.MCPClient') as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.call_tool.return_value = {"status": "ok"}
-                mock_client_class.return_value = mock_client
-                
-                result = await tool.call(test_param="value")
-                assert result == {"status": "ok"}
+            mock_client = AsyncMock()
+            mock_client.call_tool.return_value = {"status": "ok"}
+            monkeypatch.setattr("eat.discovery.MCPClient",
+                                MagicMock(return_value=mock_client))
+            
+            result = await tool.call(test_param="value")
+            assert result == {"status": "ok"}
+        finally:
+            await catalog.aclose()
 
 
 if __name__ == "__main__":
@@ -4,330 +4,292 @@ Tests for EAT Framework MCP client functionality.
 
 import pytest
 import json
-from unittest.mock import AsyncMock, patch, MagicMock
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock
 
 from eat.mcp_client import MCPClient, MCPError
 
 
 class TestMCPClient:
     """Test cases for MCPClient class."""
-    
-    @pytest.fixture
-    def client(self):
-        """Create test MCP client."""
-        return MCPClient("http://localhost:3001", timeout=10)
-    
+
+    @pytest.fixture(scope="session")
+    def client(self, mcp_transport):
+        """Create one MCP client for the whole session.
+
+        The client talks to the shared in-memory transport instead of a
+        patched aiohttp session: tests register canned JSON-RPC payloads
+        by method name and assert on the captured request body.
+        """
+        client = MCPClient("http://localhost:3001", timeout=10)
+        client._session = mcp_transport
+        return client
+
+    @pytest.fixture(autouse=True)
+    def _reset_transport(self, mcp_transport):
+        """Clear canned responses and captured state between tests."""
+        mcp_transport.reset()
+
     @pytest.fixture
     def mock_tool(self):
         """Mock tool for testing."""
         tool = MagicMock()
         tool.id = "test_tool"
         return tool
+
+    _LIST_TOOLS = [
+        {
+            "name": "tool1",
+            "description": "First tool",
+            "inputSchema": {"type": "object"}
+        },
+        {
+            "name": "tool2",
+            "description": "Second tool",
+            "inputSchema": {"type": "object"}
+        }
+    ]
     
-    @pytest.mark.asyncio
-    async def test_call_tool_success(self, client, mock_tool):
-        """Test successful tool call."""
-        expected_result = {"output": "test result", "status": "success"}
-        
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Mock HTTP response
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_response.json = AsyncMock(return_value={
-                "jsonrpc": "2.0",
-                "id": "test_id",
-                "result": expected_result
-            })
-            
-            mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Test tool call
-            result = await client.call_tool(mock_tool, {"input": "test"})
-            
-            assert result == expected_result
-            
-            # Verify the request was made correctly
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            
-            # Check URL
-            assert call_args[1]['url'] == "http://localhost:3001/mcp"
-            
-            # Check request body
-            request_data = call_args[1]['json']
-            assert request_data['jsonrpc'] == "2.0"
-            assert request_data['method'] == "tools/call"
-            assert request_data['params']['name'] == "test_tool"
-            assert request_data['params']['arguments'] == {"input": "test"}
-    
-    @pytest.mark.asyncio
-    async def test_call_tool_with_mcp_error(self, client, mock_tool):
-        """Test tool call that returns MCP error."""
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Mock HTTP response with MCP error
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_response.json = AsyncMock(return_value={
-                "jsonrpc": "2.0",
-                "id": "test_id",
-                "error": {
-                    "code": -32603,
-                    "message": "Tool execution failed"
-                }
-            })
-            
-            mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Test that MCPError is raised
-            with pytest.raises(MCPError, match="MCP Error -32603: Tool execution failed"):
-                await client.call_tool(mock_tool, {"input": "test"})
-    
-    @pytest.mark.asyncio
-    async def test_call_tool_with_http_error(self, client, mock_tool):
-        """Test tool call with HTTP error."""
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Mock HTTP error
-            from aiohttp import ClientError
-            mock_post.side_effect = ClientError("Connection failed")
-            
-            with pytest.raises(MCPError, match="Network error: Connection failed"):
-                await client.call_tool(mock_tool, {"input": "test"})
-    
-    @pytest.mark.asyncio
-    async def test_list_tools_success(self, client):
-        """Test successful tools listing."""
-        expected_tools = [
-            {
-                "name": "tool1",
-                "description": "First tool",
-                "inputSchema": {"type": "object"}
+    _TOOL_SCHEMA = {
+        "name": "test_tool",
+        "description": "Test tool",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "input": {"type": "string"}
             },
-            {
-                "name": "tool2",
-                "description": "Second tool",
-                "inputSchema": {"type": "object"}
-            }
-        ]
-        
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Mock HTTP response
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_response.json = AsyncMock(return_value={
-                "jsonrpc": "2.0",
-                "id": "list_tools",
-                "result": {"tools": expected_tools}
-            })
-            
-            mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Test list tools
-            result = await client.list_tools()
-            
-            assert result == expected_tools
-            
-            # Verify the request
-            call_args = mock_post.call_args
-            request_data = call_args[1]['json']
-            assert request_data['method'] == "tools/list"
-            assert request_data['params'] == {}
+            "required": ["input"]
+        }
+    }
     
     @pytest.mark.asyncio
-    async def test_get_tool_schema_success(self, client):
-        """Test successful tool schema retrieval."""
-        expected_schema = {
-            "name": "test_tool",
-            "description": "Test tool",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "input": {"type": "string"}
-                },
-                "required": ["input"]
-            }
+    @pytest.mark.parametrize("method,result_payload,invoke,expected,expected_params", [
+        (
+            "tools/call",
+            {"output": "test result", "status": "success"},
+            lambda client, tool: client.call_tool(tool, {"input": "test"}),
+            {"output": "test result", "status": "success"},
+            {"name": "test_tool", "arguments": {"input": "test"}},
+        ),
+        (
+            "tools/list",
+            {"tools": _LIST_TOOLS},
+            lambda client, tool: client.list_tools(),
+            _LIST_TOOLS,
+            {},
+        ),
+        (
+            "tools/get",
+            _TOOL_SCHEMA,
+            lambda client, tool: client.get_tool_schema("test_tool"),
+            _TOOL_SCHEMA,
+            {"name": "test_tool"},
+        ),
+    ], ids=["call_tool", "list_tools", "get_tool_schema"])
+    async def test_rpc_method_success(self, client, mcp_transport, mock_tool,
+                                      method, result_payload, invoke,
+                                      expected, expected_params):
+        """One data-driven case covers the three JSON-RPC success paths.
+        
+        The scaffolding is identical for every method; only the payload,
+        the invocation, and the expected request body differ.
+        """
+        mcp_transport.responses[method] = {
+            "jsonrpc": "2.0",
+            "id": "test_id",
+            "result": result_payload
         }
         
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Mock HTTP response
-            mock_response = AsyncMock()
-            mock_response.status_code = 200
-            mock_response.raise_for_status = MagicMock()
-            mock_response.json = AsyncMock(return_value={
-                "jsonrpc": "2.0",
-                "id": "schema_test_tool",
-                "result": expected_schema
-            })
-            
-            mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
-            
-            # Test get tool schema
-            result = await client.get_tool_schema("test_tool")
-            
-            assert result == expected_schema
-            
-            # Verify the request
-            call_args = mock_post.call_args
-            request_data = call_args[1]['json']
-            assert request_data['method'] == "tools/get"
-            assert request_data['params']['name'] == "test_tool"
+        result = await invoke(client, mock_tool)
+        
+        assert result == expected
+        
+        # Verify the request was made correctly
+        assert mcp_transport.request_count == 1
+        assert mcp_transport.last_url == "http://localhost:3001/mcp"
+        
+        request_data = mcp_transport.last_request_body
+        assert request_data['jsonrpc'] == "2.0"
+        assert request_data['method'] == method
+        assert request_data['params'] == expected_params
     
+    def test_build_request(self):
+        """_build_request frames the envelope and advances the id counter."""
+        client = MCPClient("http://localhost:3001")
+
+        first = client._build_request("tools/call", {"name": "t", "arguments": {}})
+        second = client._build_request("tools/list", {})
+
+        assert first == {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "t", "arguments": {}}
+        }
+        assert second["id"] == 2
+        assert second["method"] == "tools/list"
+
+    def test_parse_response_success(self):
+        """_parse_response unwraps the result member."""
+        payload = {"jsonrpc": "2.0", "id": 1, "result": {"output": "ok"}}
+        assert MCPClient._parse_response(payload) == {"output": "ok"}
+        # A response with neither result nor error maps to an empty dict.
+        assert MCPClient._parse_response({"jsonrpc": "2.0", "id": 2}) == {}
+
+    def test_call_tool_with_mcp_error(self):
+        """An error member raises MCPError; no event loop required."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": "test_id",
+            "error": {
+                "code": -32603,
+                "message": "Tool execution failed"
+            }
+        }
+
+        with pytest.raises(MCPError, match="MCP Error -32603: Tool execution failed"):
+            MCPClient._parse_response(payload)
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_http_error(self, client, mcp_transport, mock_tool):
+        """Test tool call with HTTP error."""
+        from aiohttp import ClientError
+        mcp_transport.error = ClientError("Connection failed")
+
+        with pytest.raises(MCPError, match="Network error: Connection failed"):
+            await client.call_tool(mock_tool, {"input": "test"})
+
     @pytest.mark.asyncio
-    async def test_client_session_management(self):
+    async def test_client_session_management(self, monkeypatch):
         """Test client session creation and cleanup."""
         client = MCPClient("http://localhost:3001")
-        
+
         # Test that session is created when needed
         assert client._session is None
-        
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
-            mock_session_class.return_value = mock_session
-            
-            session = await client._get_session()
-            assert session == mock_session
-            assert client._session == mock_session
-            
-            # Test that same session is returned on subsequent calls
-            session2 = await client._get_session()
-            assert session2 == mock_session
-            
-            # Test session cleanup
-            await client.close()
-            mock_session.close.assert_called_once()
-            assert client._session is None
-    
+
+        mock_session = AsyncMock()
+        monkeypatch.setattr("aiohttp.ClientSession", MagicMock(return_value=mock_session))
+
+        session = await client._get_session()
+        assert session == mock_session
+        assert client._session == mock_session
+
+        # Test that same session is returned on subsequent calls
+        session2 = await client._get_session()
+        assert session2 == mock_session
+
+        # Test session cleanup
+        await client.close()
+        mock_session.close.assert_called_once()
+        assert client._session is None
+
     @pytest.mark.asyncio
-    async def test_context_manager(self):
+    async def test_context_manager(self, monkeypatch):
         """Test using MCPClient as context manager."""
-        with patch('aiohttp.ClientSession') as mock_session_class:
-            mock_session = AsyncMock()
-            mock_session_class.return_value = mock_session
-            
-            async with MCPClient("http://localhost:3001") as client:
-                assert isinstance(client, MCPClient)
-                # Session should be created
-                session = await client._get_session()
-                assert session == mock_session
-            
-            # Session should be closed after context exit
-            mock_session.close.assert_called_once()
-    
+        mock_session = AsyncMock()
+        monkeypatch.setattr("aiohttp.ClientSession", MagicMock(return_value=mock_session))
+
+        async with MCPClient("http://localhost:3001") as client:
+            assert isinstance(client, MCPClient)
+            # Session should be created
+            session = await client._get_session()
+            assert session == mock_session
+
+        # Session should be closed after context exit
+        mock_session.close.assert_called_once()
+
     def test_client_initialization(self):
         """Test client initialization with different parameters."""
         # Default timeout
         client1 = MCPClient("http://localhost:3001")
         assert client1.endpoint == "http://localhost:3001"
         assert client1.timeout == 30
-        
+
         # Custom timeout
         client2 = MCPClient("http://localhost:3002", timeout=60)
         assert client2.endpoint == "http://localhost:3002"
         assert client2.timeout == 60
-        
+
         # URL normalization (trailing slash removal)
         client3 = MCPClient("http://localhost:3003/")
         assert client3.endpoint == "http://localhost:3003"
 
 
-class TestMCPError:
-    """Test cases for MCPError exception."""
-    
-    def test_mcp_error_creation(self):
-        """Test MCPError exception creation."""
-        error = MCPError("Test error message")
-        assert str(error) == "Test error message"
-        assert isinstance(error, Exception)
-    
-    def test_mcp_error_inheritance(self):
-        """Test that MCPError inherits from Exception."""
-        error = MCPError("Test error")
-        assert isinstance(error, Exception)
-
-
 class TestMCPClientIntegration:
     """Integration tests for MCP client."""
-    
+
+    @pytest.fixture(autouse=True)
+    def _reset_transport(self, mcp_transport):
+        """Clear canned responses and captured state between tests."""
+        mcp_transport.reset()
+
     @pytest.mark.asyncio
-    async def test_full_mcp_workflow(self):
+    async def test_full_mcp_workflow(self, mcp_transport):
         """Test complete MCP workflow: list tools, get schema, call tool."""
         client = MCPClient("http://localhost:3001")
-        
+        client._session = mcp_transport
+
         # Mock tool for call
         mock_tool = MagicMock()
         mock_tool.id = "integration_tool"
-        
-        with patch('aiohttp.ClientSession.post') as mock_post:
-            # Set up responses for different calls
-            responses = [
-                # list_tools response
-                {
-                    "jsonrpc": "2.0",
-                    "id": "list_tools",
-                    "result": {
-                        "tools": [
-                            {
-                                "name": "integration_tool",
-                                "description": "Integration test tool"
-                            }
-                        ]
-                    }
-                },
-                # get_tool_schema response
+
+        # The transport dispatches by JSON-RPC method, so all three
+        # canned responses are registered once up front.
+        mcp_transport.responses.update({
+            "tools/list": {
+                "jsonrpc": "2.0",
+                "id": "list_tools",
+                "result": {
+                    "tools": [
+                        {
+                            "name": "integration_tool",
+                            "description": "Integration test tool"
+                        }
+                    ]
+                }
+            },
+            "tools/get": {
+                "jsonrpc": "2.0",
+                "id": "schema_integration_tool",
+                "result": {
+                    "name": "integration_tool",
+                    "inputSchema": {"type": "object"}
+                }
+            },
+            # Repeated calls to the same method consume a deque in order.
+            "tools/call": deque([
                 {
                     "jsonrpc": "2.0",
-                    "id": "schema_integration_tool",
-                    "result": {
-                        "name": "integration_tool",
-                        "inputSchema": {"type": "object"}
-                    }
+                    "id": "call_integration_tool",
+                    "result": {"output": "integration success"}
                 },
-                # call_tool response
                 {
                     "jsonrpc": "2.0",
-                    "id": "call_integration_tool",
-                    "result": {"output": "integration success"}
+                    "id": "call_integration_tool_2",
+                    "result": {"output": "second call"}
                 }
-            ]
-            
-            # Mock HTTP responses
-            mock_responses = []
-            for response_data in responses:
-                mock_response = AsyncMock()
-                mock_response.status_code = 200
-                mock_response.raise_for_status = MagicMock()
-                mock_response.json = AsyncMock(return_value=response_data)
-                mock_responses.append(mock_response)
-            
-            # Set up context managers for responses
-            for i, mock_response in enumerate(mock_responses):
-                mock_post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
-                mock_post.return_value.__aexit__ = AsyncMock(return_value=None)
-                
-                if i == 0:
-                    # Test list tools
-                    tools = await client.list_tools()
-                    assert len(tools) == 1
-                    assert tools[0]["name"] == "integration_tool"
-                
-                elif i == 1:
-                    # Test get tool schema
-                    schema = await client.get_tool_schema("integration_tool")
-                    assert schema["name"] == "integration_tool"
-                
-                elif i == 2:
-                    # Test call tool
-                    result = await client.call_tool(mock_tool, {"param": "value"})
-                    assert result == {"output": "integration success"}
-        
+            ])
+        })
+
+        # Test list tools
+        tools = await client.list_tools()
+        assert len(tools) == 1
+        assert tools[0]["name"] == "integration_tool"
+
+        # Test get tool schema
+        schema = await client.get_tool_schema("integration_tool")
+        assert schema["name"] == "integration_tool"
+
+        # Test call tool; sequential calls drain the queued responses
+        result = await client.call_tool(mock_tool, {"param": "value"})
+        assert result == {"output": "integration success"}
+
+        result = await client.call_tool(mock_tool, {"param": "other"})
+        assert result == {"output": "second call"}
+        assert mcp_transport.request_count == 4
+
         await client.close()
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])